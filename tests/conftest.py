@@ -4,9 +4,13 @@ This module provides common fixtures and pytest configuration that can be
 used across all test modules in the ticket analyzer test suite.
 """
 
+import hashlib
+import importlib
+import re
 import pytest
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Set
 from unittest.mock import Mock, patch
 
 from ticket_analyzer.models.ticket import Ticket, TicketStatus, TicketSeverity
@@ -113,9 +117,9 @@ def sample_search_criteria() -> SearchCriteria:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_analysis_result() -> AnalysisResult:
-    """Sample AnalysisResult for testing."""
+    """Read-only sample AnalysisResult, shared per session."""
     metrics = {
         "total_tickets": 150,
         "avg_resolution_time": 24.5,
@@ -297,11 +301,18 @@ def temp_output_directory(tmp_path):
     return str(output_dir)
 
 
+@pytest.fixture(scope="session")
+def shared_dir(tmp_path_factory):
+    """Session-wide existing directory for tests that only need *a* directory."""
+    return tmp_path_factory.mktemp("cfg_dir_reject")
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+        "markers", "slow: marks tests as slow (skipped by default; run everything with "
+        "-m \"slow or not slow\")"
     )
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
@@ -311,6 +322,112 @@ def pytest_configure(config):
     )
 
 
+# --skip-unchanged bookkeeping. Each depends_on test has its own cache key, so a
+# digest is only ever recorded for a test that was selected and passed.
+# Results are tracked wherever reports arrive: the xdist controller, or the only
+# process when xdist is not in use. Node ids are normalised first because
+# --dist=loadgroup appends "@<group>" to xdist_group tests, and a digest saved
+# in a parallel run must still match an -n 0 run (and vice versa).
+_DEPENDS_ON_DIGESTS: Dict[str, str] = {}
+_DEPENDS_ON_PENDING: Dict[str, str] = {}
+_DEPENDS_ON_PASSED: Set[str] = set()
+_DEPENDS_ON_FAILED: Set[str] = set()
+_XDIST_GROUP_SUFFIX = re.compile(r"@[^@\[\]/:]+$")
+
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for skipping tests whose sources are unchanged."""
+    parser.addoption(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="skip tests marked depends_on(module) when neither the module nor "
+             "the test file changed since they last passed"
+    )
+
+
+def _skip_unchanged_enabled(config) -> bool:
+    """Return whether --skip-unchanged is on and the cache plugin is available."""
+    return (config.getoption("--skip-unchanged")
+            and getattr(config, "cache", None) is not None)
+
+
+def _depends_on_nodeid(nodeid: str) -> str:
+    """Strip the "@<group>" suffix xdist's loadgroup mode adds to a node id."""
+    return _XDIST_GROUP_SUFFIX.sub("", nodeid)
+
+
+def _depends_on_key(nodeid: str) -> str:
+    """Return the cache key holding the last passing digest of one test."""
+    return f"depends_on/{_depends_on_nodeid(nodeid)}"
+
+
+def _depends_on_digest(item, module_name: str) -> str:
+    """Hash the source of the dependency module together with the test file."""
+    module = importlib.import_module(module_name)
+    digest = hashlib.md5(Path(module.__file__).read_bytes())
+    digest.update(Path(item.module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip depends_on tests whose sources match their last passing run."""
+    if not _skip_unchanged_enabled(config):
+        return
+    
+    skip = pytest.mark.skip(reason="dependency and test sources unchanged")
+    for item in items:
+        marker = item.get_closest_marker("depends_on")
+        if marker is None:
+            continue
+        
+        digest = _depends_on_digest(item, marker.args[0])
+        if config.cache.get(_depends_on_key(item.nodeid), None) == digest:
+            item.add_marker(skip)
+        else:
+            _DEPENDS_ON_DIGESTS[_depends_on_nodeid(item.nodeid)] = digest
+
+
+def pytest_collection_finish(session):
+    """Keep only the depends_on tests left after -k/-m deselection."""
+    for item in session.items:
+        nodeid = _depends_on_nodeid(item.nodeid)
+        if nodeid in _DEPENDS_ON_DIGESTS:
+            _DEPENDS_ON_PENDING[nodeid] = _DEPENDS_ON_DIGESTS[nodeid]
+
+
+def pytest_runtest_logreport(report):
+    """Track passing and failing tests for the depends_on digests."""
+    nodeid = _depends_on_nodeid(report.nodeid)
+    if report.failed:
+        _DEPENDS_ON_FAILED.add(nodeid)
+    elif report.when == "call" and report.passed:
+        _DEPENDS_ON_PASSED.add(nodeid)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the pending digests an xdist worker built from its collection."""
+    worker_output = getattr(node, "workeroutput", {})
+    _DEPENDS_ON_PENDING.update(worker_output.get("depends_on_pending", {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Record the digest of every selected depends_on test that passed."""
+    config = session.config
+    if hasattr(config, "workerinput"):
+        # xdist worker: hand the pending digests to the controller, which sees
+        # every report regardless of how tests were distributed.
+        config.workeroutput["depends_on_pending"] = _DEPENDS_ON_PENDING
+        return
+    if not _skip_unchanged_enabled(config):
+        return
+    
+    for nodeid, digest in _DEPENDS_ON_PENDING.items():
+        if nodeid in _DEPENDS_ON_PASSED and nodeid not in _DEPENDS_ON_FAILED:
+            config.cache.set(_depends_on_key(nodeid), digest)
+
+
 # Custom pytest markers for test categorization
 pytestmark = pytest.mark.unit  # Mark all tests in this module as unit tests
 
@@ -4,9 +4,12 @@ This module contains basic unit tests for the validation components
 that actually exist in the codebase.
 """
 
+import functools
+import re
+
 import pytest
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from unittest.mock import Mock, patch
 
 from ticket_analyzer.data_retrieval.validation import (
@@ -15,25 +18,64 @@ from ticket_analyzer.data_retrieval.validation import (
 )
 from ticket_analyzer.models import (
     SearchCriteria,
+    TicketStatus,
     ValidationError
 )
 
 
+# Patterns are unanchored and applied with fullmatch()
+_TICKET_ID_RE = re.compile(r'[A-Z]{1,10}-?\d{1,15}')
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9._-]{1,50}')
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+_TOO_LONG_USERNAME = "a" * 51
+
+# Common SQL injection patterns, fused into one case-sensitive alternation.
+# Sources are lowercase, so inputs are lowered once before searching.
+_SQL_INJECTION_RE = re.compile("|".join([
+    r"('|(\\')|(;)|(\\;))",  # Quotes and semicolons
+    r"(union(\s|\+)+select)",  # Union select
+    r"(drop(\s|\+)+table)",  # Drop table
+    r"(insert(\s|\+)+into)",  # Insert into
+    r"(delete(\s|\+)+from)"  # Delete from
+]))
+
+_XSS_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=2048)
+def _make_criteria(status: Optional[Tuple[TicketStatus, ...]],
+                   assignee: Optional[str],
+                   max_results: int) -> SearchCriteria:
+    """Build (and memoize) SearchCriteria for identical arguments.
+    
+    Returned instances are shared between callers and must be treated
+    as read-only.
+    """
+    return SearchCriteria(
+        status=list(status) if status else None,
+        assignee=assignee,
+        max_results=max_results
+    )
+
+
+@pytest.fixture(scope="module")
+def validator() -> InputValidator:
+    """Shared InputValidator instance, constructed once per module."""
+    return InputValidator()
+
+
 class TestInputValidator:
     """Test cases for InputValidator class."""
     
-    def test_input_validator_initialization(self) -> None:
+    def test_input_validator_initialization(self, validator: InputValidator) -> None:
         """Test InputValidator initialization."""
-        validator = InputValidator()
-        
         # Should initialize without errors
         assert validator is not None
         assert hasattr(validator, 'MAX_LENGTHS')
     
     def test_validation_rule_creation(self) -> None:
         """Test ValidationRule dataclass creation."""
-        import re
-        
         rule = ValidationRule(
             pattern=re.compile(r'^[A-Z]+-?\d+$'),
             max_length=50,
@@ -50,8 +92,6 @@ class TestInputValidator:
     
     def test_search_criteria_basic_validation(self) -> None:
         """Test basic SearchCriteria validation."""
-        from ticket_analyzer.models import TicketStatus
-        
         # Valid search criteria
         criteria = SearchCriteria(
             status=[TicketStatus.OPEN, TicketStatus.RESOLVED],
@@ -88,18 +128,12 @@ class TestInputValidator:
 class TestValidationIntegration:
     """Integration tests for validation components."""
     
-    def test_validator_with_search_criteria(self) -> None:
+    def test_validator_with_search_criteria(self, validator: InputValidator) -> None:
         """Test validator integration with search criteria."""
-        from ticket_analyzer.models import TicketStatus
-        
-        validator = InputValidator()
+        assert validator is not None
         
         # Create search criteria
-        criteria = SearchCriteria(
-            status=[TicketStatus.OPEN],
-            assignee="testuser",
-            max_results=100
-        )
+        criteria = _make_criteria((TicketStatus.OPEN,), "testuser", 100)
         
         # Should work without errors
         assert criteria.status == [TicketStatus.OPEN]
@@ -137,227 +171,166 @@ class TestValidationIntegration:
 class TestValidationPatterns:
     """Test validation patterns and rules."""
     
-    def test_ticket_id_pattern_validation(self) -> None:
-        """Test ticket ID pattern validation."""
-        import re
-        
-        # Common ticket ID patterns
-        ticket_id_pattern = re.compile(r'^[A-Z]{1,10}-?\d{1,15}$')
-        
-        valid_ids = [
-            "T123456",
-            "P789012",
-            "CFN-12345",
-            "SWIM-98765"
-        ]
-        
-        invalid_ids = [
-            "",
-            "123456",  # No prefix
-            "t123456",  # Lowercase
-            "T-",  # No number
-            "TOOLONGPREFIX-123"  # Too long prefix
-        ]
-        
-        for ticket_id in valid_ids:
-            assert ticket_id_pattern.match(ticket_id) is not None, f"Should match: {ticket_id}"
-        
-        for ticket_id in invalid_ids:
-            assert ticket_id_pattern.match(ticket_id) is None, f"Should not match: {ticket_id}"
+    @pytest.mark.parametrize("ticket_id", [
+        "T123456",
+        "P789012",
+        "CFN-12345",
+        "SWIM-98765"
+    ])
+    def test_ticket_id_valid(self, ticket_id: str) -> None:
+        """Test ticket ID pattern accepts valid IDs."""
+        assert _TICKET_ID_RE.fullmatch(ticket_id) is not None, f"Should match: {ticket_id}"
     
-    def test_username_pattern_validation(self) -> None:
-        """Test username pattern validation."""
-        import re
-        
-        username_pattern = re.compile(r'^[a-zA-Z0-9._-]{1,50}$')
-        
-        valid_usernames = [
-            "testuser",
-            "test.user",
-            "test_user",
-            "test-user",
-            "user123"
-        ]
-        
-        invalid_usernames = [
-            "",
-            "test user",  # Space
-            "test@user",  # Invalid character
-            "a" * 51  # Too long
-        ]
-        
-        for username in valid_usernames:
-            assert username_pattern.match(username) is not None, f"Should match: {username}"
-        
-        for username in invalid_usernames:
-            assert username_pattern.match(username) is None, f"Should not match: {username}"
+    @pytest.mark.parametrize("ticket_id", [
+        "",
+        "123456",  # No prefix
+        "t123456",  # Lowercase
+        "T-",  # No number
+        "TOOLONGPREFIX-123"  # Too long prefix
+    ])
+    def test_ticket_id_invalid(self, ticket_id: str) -> None:
+        """Test ticket ID pattern rejects invalid IDs."""
+        assert _TICKET_ID_RE.fullmatch(ticket_id) is None, f"Should not match: {ticket_id}"
     
-    def test_date_validation_patterns(self) -> None:
-        """Test date validation patterns."""
-        import re
-        
-        date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-        
-        valid_dates = [
-            "2024-01-01",
-            "2024-12-31",
-            "2023-02-28"
-        ]
-        
-        invalid_dates = [
-            "",
-            "2024-1-1",  # Single digit
-            "24-01-01",  # Two digit year
-            "2024/01/01",  # Wrong separator
-            "not-a-date"
-        ]
-        
-        for date_str in valid_dates:
-            assert date_pattern.match(date_str) is not None, f"Should match: {date_str}"
-        
-        for date_str in invalid_dates:
-            assert date_pattern.match(date_str) is None, f"Should not match: {date_str}"
+    @pytest.mark.parametrize("username", [
+        "testuser",
+        "test.user",
+        "test_user",
+        "test-user",
+        "user123"
+    ])
+    def test_username_valid(self, username: str) -> None:
+        """Test username pattern accepts valid usernames."""
+        assert _USERNAME_RE.fullmatch(username) is not None, f"Should match: {username}"
+    
+    @pytest.mark.parametrize("username", [
+        "",
+        "test user",  # Space
+        "test@user",  # Invalid character
+        pytest.param(_TOO_LONG_USERNAME, id="too_long")
+    ])
+    def test_username_invalid(self, username: str) -> None:
+        """Test username pattern rejects invalid usernames."""
+        assert _USERNAME_RE.fullmatch(username) is None, f"Should not match: {username}"
+    
+    @pytest.mark.parametrize("date_str", [
+        "2024-01-01",
+        "2024-12-31",
+        "2023-02-28"
+    ])
+    def test_date_valid(self, date_str: str) -> None:
+        """Test valid dates parse as real calendar dates."""
+        parsed = datetime.strptime(date_str, "%Y-%m-%d")
+        assert parsed.strftime("%Y-%m-%d") == date_str
+    
+    @pytest.mark.parametrize("date_str", [
+        "2024-02-31",  # No such day
+        "2023-13-01"  # No such month
+    ])
+    def test_date_well_formed_but_impossible(self, date_str: str) -> None:
+        """Test dates that pass the shape check but are not real dates."""
+        assert _DATE_RE.fullmatch(date_str) is not None
+        with pytest.raises(ValueError):
+            datetime.strptime(date_str, "%Y-%m-%d")
+    
+    @pytest.mark.parametrize("date_str", [
+        "",
+        "2024-1-1",  # Single digit
+        "24-01-01",  # Two digit year
+        "2024/01/01",  # Wrong separator
+        "not-a-date"
+    ])
+    def test_date_invalid(self, date_str: str) -> None:
+        """Test date pattern rejects malformed dates."""
+        assert _DATE_RE.fullmatch(date_str) is None, f"Should not match: {date_str}"
 
 
 class TestSecurityValidation:
     """Test security-focused validation."""
     
-    def test_sql_injection_detection_patterns(self) -> None:
-        """Test SQL injection detection patterns."""
-        import re
-        
-        # Common SQL injection patterns
-        sql_injection_patterns = [
-            r"('|(\\')|(;)|(\\;))",  # Quotes and semicolons
-            r"(union(\s|\+)+select)",  # Union select
-            r"(drop(\s|\+)+table)",  # Drop table
-            r"(insert(\s|\+)+into)",  # Insert into
-            r"(delete(\s|\+)+from)"  # Delete from
-        ]
-        
-        injection_attempts = [
-            "'; DROP TABLE tickets; --",
-            "' OR '1'='1",
-            "' UNION SELECT * FROM users --",
-            "'; INSERT INTO tickets VALUES --",
-            "' OR 1=1 --"
-        ]
-        
-        safe_inputs = [
-            "normal search term",
-            "search for bug",
-            "ticket about authentication",
-            "error in production"
-        ]
-        
-        # Test that injection attempts are detected
-        for attempt in injection_attempts:
-            detected = False
-            for pattern in sql_injection_patterns:
-                if re.search(pattern, attempt, re.IGNORECASE):
-                    detected = True
-                    break
-            assert detected, f"Should detect injection in: {attempt}"
-        
-        # Test that safe inputs are not flagged
-        for safe_input in safe_inputs:
-            detected = False
-            for pattern in sql_injection_patterns:
-                if re.search(pattern, safe_input, re.IGNORECASE):
-                    detected = True
-                    break
-            assert not detected, f"Should not detect injection in: {safe_input}"
+    @pytest.mark.parametrize("attempt", [
+        "'; DROP TABLE tickets; --",
+        "' OR '1'='1",
+        "' UNION SELECT * FROM users --",
+        "'; INSERT INTO tickets VALUES --",
+        "' OR 1=1 --"
+    ])
+    def test_sql_injection_detected(self, attempt: str) -> None:
+        """Test that SQL injection attempts are detected."""
+        assert _SQL_INJECTION_RE.search(attempt.lower()) is not None, \
+            f"Should detect injection in: {attempt}"
     
-    def test_xss_prevention_patterns(self) -> None:
-        """Test XSS prevention patterns."""
-        import re
-        
-        xss_pattern = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
-        
-        xss_attempts = [
-            "<script>alert('xss')</script>",
-            "<SCRIPT>alert('XSS')</SCRIPT>",
-            "<script type='text/javascript'>alert('xss')</script>"
-        ]
-        
-        safe_inputs = [
-            "normal text",
-            "text with <b>bold</b> tags",
-            "script without tags"
-        ]
-        
-        for attempt in xss_attempts:
-            assert xss_pattern.search(attempt) is not None, f"Should detect XSS in: {attempt}"
-        
-        for safe_input in safe_inputs:
-            if "<script" not in safe_input.lower():
-                assert xss_pattern.search(safe_input) is None, f"Should not detect XSS in: {safe_input}"
+    @pytest.mark.parametrize("safe_input", [
+        "normal search term",
+        "search for bug",
+        "ticket about authentication",
+        "error in production"
+    ])
+    def test_sql_injection_safe_input(self, safe_input: str) -> None:
+        """Test that safe inputs are not flagged as SQL injection."""
+        assert _SQL_INJECTION_RE.search(safe_input.lower()) is None, \
+            f"Should not detect injection in: {safe_input}"
+    
+    @pytest.mark.parametrize("attempt", [
+        "<script>alert('xss')</script>",
+        "<SCRIPT>alert('XSS')</SCRIPT>",
+        "<script type='text/javascript'>alert('xss')</script>"
+    ])
+    def test_xss_detected(self, attempt: str) -> None:
+        """Test that XSS attempts are detected."""
+        assert _XSS_RE.search(attempt) is not None, f"Should detect XSS in: {attempt}"
+    
+    @pytest.mark.parametrize("safe_input", [
+        "normal text",
+        "text with <b>bold</b> tags",
+        "script without tags"
+    ])
+    def test_xss_safe_input(self, safe_input: str) -> None:
+        """Test that safe inputs are not flagged as XSS."""
+        assert _XSS_RE.search(safe_input) is None, f"Should not detect XSS in: {safe_input}"
 
 
 class TestValidationPerformance:
     """Test validation performance with large datasets."""
     
     @pytest.mark.performance
-    def test_validation_performance_with_large_input(self) -> None:
+    def test_validation_performance_with_large_input(self, benchmark: Any) -> None:
         """Test validation performance with large input."""
-        import time
-        
-        from ticket_analyzer.models import TicketStatus
-        
-        # Generate large search criteria list
+        # Generate large search criteria list; assignees repeat so the
+        # memoized factory returns shared instances for identical inputs
         large_criteria_list = [
-            SearchCriteria(
-                status=[TicketStatus.OPEN, TicketStatus.RESOLVED],
-                assignee=f"user{i}",
-                max_results=100
+            _make_criteria(
+                (TicketStatus.OPEN, TicketStatus.RESOLVED),
+                f"user{i % 100}",
+                100
             )
             for i in range(1000)
         ]
         
-        start_time = time.time()
-        
-        # Process all criteria
-        processed_count = 0
-        for criteria in large_criteria_list:
-            # Basic validation - just check that objects are created properly
-            if criteria.status and criteria.assignee:
-                processed_count += 1
-        
-        end_time = time.time()
+        # Basic validation - just check that objects are created properly
+        processed_count = benchmark(
+            lambda: sum(1 for c in large_criteria_list if c.status and c.assignee)
+        )
         
         assert processed_count == 1000
-        assert end_time - start_time < 1.0  # Should complete within 1 second
     
     @pytest.mark.performance
-    def test_pattern_matching_performance(self) -> None:
+    def test_pattern_matching_performance(self, benchmark: Any) -> None:
         """Test pattern matching performance."""
-        import re
-        import time
-        
-        # Compile patterns once
-        ticket_id_pattern = re.compile(r'^[A-Z]{1,10}-?\d{1,15}$')
-        username_pattern = re.compile(r'^[a-zA-Z0-9._-]{1,50}$')
-        
         # Generate test data
         test_ticket_ids = [f"T{i:06d}" for i in range(1000)]
         test_usernames = [f"user{i}" for i in range(1000)]
         
-        start_time = time.time()
-        
-        # Validate all ticket IDs
-        valid_ticket_count = 0
-        for ticket_id in test_ticket_ids:
-            if ticket_id_pattern.match(ticket_id):
-                valid_ticket_count += 1
+        # Bind the match methods once so the loops skip attribute lookups
+        match_ticket_id = _TICKET_ID_RE.fullmatch
+        match_username = _USERNAME_RE.fullmatch
         
-        # Validate all usernames
-        valid_username_count = 0
-        for username in test_usernames:
-            if username_pattern.match(username):
-                valid_username_count += 1
+        def validate_all() -> Tuple[int, int]:
+            valid_ticket_count = sum(1 for tid in test_ticket_ids if match_ticket_id(tid))
+            valid_username_count = sum(1 for name in test_usernames if match_username(name))
+            return valid_ticket_count, valid_username_count
         
-        end_time = time.time()
+        valid_ticket_count, valid_username_count = benchmark(validate_all)
         
         assert valid_ticket_count == 1000
         assert valid_username_count == 1000
-        assert end_time - start_time < 0.5  # Should complete within 0.5 seconds
\ No newline at end of file
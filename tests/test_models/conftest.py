@@ -0,0 +1,109 @@
+"""Shared fixtures for model tests.
+
+Default-constructed configuration objects are built once per module and
+must be treated as read-only. Tests that mutate a configuration should use
+the function-scoped ``app_config`` copy instead. The same applies to the
+session-wide ``base_error``: tests that call ``add_detail`` must build their
+own exception.
+"""
+
+import dataclasses
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+
+from ticket_analyzer.models.config import (
+    ReportConfig, AuthConfig, MCPConfig, LoggingConfig, ApplicationConfig
+)
+from ticket_analyzer.models.exceptions import TicketAnalysisError
+from ticket_analyzer.models.ticket import Ticket, TicketStatus, TicketSeverity
+
+
+@pytest.fixture(scope="module")
+def default_report_config() -> ReportConfig:
+    """Read-only default ReportConfig, shared per module."""
+    return ReportConfig()
+
+
+@pytest.fixture(scope="module")
+def default_auth_config() -> AuthConfig:
+    """Read-only default AuthConfig, shared per module."""
+    return AuthConfig()
+
+
+@pytest.fixture(scope="module")
+def default_mcp_config() -> MCPConfig:
+    """Read-only default MCPConfig, shared per module."""
+    return MCPConfig()
+
+
+@pytest.fixture(scope="module")
+def default_logging_config() -> LoggingConfig:
+    """Read-only default LoggingConfig, shared per module."""
+    return LoggingConfig()
+
+
+@pytest.fixture(scope="module")
+def default_app_config() -> ApplicationConfig:
+    """Read-only default ApplicationConfig, shared per module."""
+    return ApplicationConfig()
+
+
+@pytest.fixture
+def app_config(default_app_config: ApplicationConfig) -> ApplicationConfig:
+    """Mutable copy of the default ApplicationConfig for a single test.
+
+    Sub-configurations are copied as well so mutating ``config.auth`` and
+    friends never leaks into the shared default.
+    """
+    return dataclasses.replace(
+        default_app_config,
+        auth=dataclasses.replace(default_app_config.auth),
+        report=dataclasses.replace(default_app_config.report),
+        mcp=dataclasses.replace(
+            default_app_config.mcp,
+            server_command=list(default_app_config.mcp.server_command)
+        ),
+        logging=dataclasses.replace(default_app_config.logging)
+    )
+
+
+@pytest.fixture(scope="session")
+def base_error() -> TicketAnalysisError:
+    """Read-only TicketAnalysisError("Test") without details, shared per session."""
+    return TicketAnalysisError("Test")
+
+
+@pytest.fixture(scope="session")
+def now_ts() -> datetime:
+    """Single wall-clock reading for tests that just need "some current time"."""
+    return datetime.now()
+
+
+@pytest.fixture(scope="session")
+def long_string() -> str:
+    """Read-only 10 000 character string for length edge cases."""
+    return "x" * 10000
+
+
+@pytest.fixture(scope="module")
+def make_ticket(now_ts: datetime) -> Callable[..., Ticket]:
+    """Factory building a Ticket from shared defaults overridden by keywords.
+    
+    Boilerplate fields are filled in once so tests only pass the fields they
+    care about; both timestamps default to the session's ``now_ts``.
+    """
+    defaults = {
+        "id": "T123",
+        "title": "Test",
+        "description": "Test",
+        "status": TicketStatus.OPEN,
+        "severity": TicketSeverity.SEV_3,
+        "created_date": now_ts,
+        "updated_date": now_ts,
+    }
+    
+    def _make_ticket(**overrides: Any) -> Ticket:
+        return Ticket(**{**defaults, **overrides})
+    return _make_ticket
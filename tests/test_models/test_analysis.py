@@ -5,9 +5,13 @@ MetricDefinition, TrendPoint, and TrendAnalysis models, covering
 dataclass instantiation, validation, conversions, and edge cases.
 """
 
+from __future__ import annotations
+
+import re
+
 import pytest
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Any
 
 from ticket_analyzer.models.analysis import (
     SearchCriteria, AnalysisResult, MetricDefinition, TrendPoint, TrendAnalysis
@@ -15,6 +19,108 @@ from ticket_analyzer.models.analysis import (
 from ticket_analyzer.models.ticket import TicketStatus, TicketSeverity
 
 
+# Fixed timestamps shared across tests, built once at import
+_D_JAN1 = datetime(2024, 1, 1)
+_D_JAN1_1000 = datetime(2024, 1, 1, 10, 0, 0)
+_D_JAN2 = datetime(2024, 1, 2)
+_D_JAN2_1000 = datetime(2024, 1, 2, 10, 0, 0)
+_D_JAN3 = datetime(2024, 1, 3)
+_D_JAN4 = datetime(2024, 1, 4)
+_D_JAN10 = datetime(2024, 1, 10)
+_D_JAN15 = datetime(2024, 1, 15)
+_D_JAN15_1000 = datetime(2024, 1, 15, 10, 0, 0)
+_D_JAN15_1030 = datetime(2024, 1, 15, 10, 30, 0)
+_D_JAN20 = datetime(2024, 1, 20)
+_D_JAN30 = datetime(2024, 1, 30)
+_D_JAN31 = datetime(2024, 1, 31)
+_D_JAN31_1800 = datetime(2024, 1, 31, 18, 0, 0)
+
+
+# (points, expected_min, expected_max, expected_latest) for TrendAnalysis
+_TREND_CASES = [
+    ([(_D_JAN1, 15.0), (_D_JAN2, 5.0), (_D_JAN3, 25.0), (_D_JAN4, 10.0)], 5.0, 25.0, 10.0),
+    # Points added in non-chronological order
+    ([(_D_JAN1, 10.0), (_D_JAN3, 30.0), (_D_JAN2, 20.0)], 10.0, 30.0, 30.0),
+    ([(_D_JAN1, 42.0)], 42.0, 42.0, 42.0),
+    ([(_D_JAN1, -10.0), (_D_JAN2, -5.0), (_D_JAN3, 0.0), (_D_JAN4, 5.0)], -10.0, 5.0, 5.0),
+    ([(_D_JAN1, 0.0), (_D_JAN2, 0.0)], 0.0, 0.0, 0.0),
+    ([(_D_JAN1, 1e10)], 1e10, 1e10, 1e10),
+]
+_TREND_CASE_IDS = [
+    "mixed_values",
+    "non_chronological",
+    "single_point",
+    "negative_values",
+    "zero_values",
+    "very_large_values",
+]
+
+# Wire values expected for the shared all-fields criteria
+_EXPECTED_STATUS_STRS = ("Open", "In Progress")
+_EXPECTED_SEVERITY_STRS = ("SEV_1", "SEV_2")
+
+# Escaped search text as it must appear in the rendered MCP query
+_ESCAPE_RE = re.compile(re.escape('error \\"authentication\\" failed'))
+
+
+@pytest.fixture(scope="module")
+def full_criteria() -> SearchCriteria:
+    """SearchCriteria with every field populated; read-only, shared per module."""
+    return SearchCriteria(
+        status=[TicketStatus.OPEN, TicketStatus.IN_PROGRESS],
+        severity=[TicketSeverity.SEV_1, TicketSeverity.SEV_2],
+        assignee="testuser",
+        resolver_group="Test Team",
+        created_after=_D_JAN1_1000,
+        created_before=_D_JAN31_1800,
+        updated_after=_D_JAN15,
+        updated_before=_D_JAN30,
+        tags=["urgent", "bug"],
+        search_text="authentication error",
+        max_results=500,
+        offset=10
+    )
+
+
+@pytest.fixture(scope="module")
+def full_query(full_criteria: SearchCriteria) -> str:
+    """MCP query rendered once from the shared all-fields criteria."""
+    return full_criteria.to_mcp_query()
+
+
+@pytest.fixture(scope="module")
+def full_query_clauses(full_query: str) -> frozenset[str]:
+    """Top-level clauses of the shared MCP query, split once."""
+    return frozenset(full_query.split(" AND "))
+
+
+@pytest.fixture(scope="module")
+def full_result() -> AnalysisResult:
+    """AnalysisResult with every field populated; read-only, shared per module."""
+    return AnalysisResult(
+        metrics={"total_tickets": 150},
+        trends={"weekly_trend": [1, 2, 3, 4]},
+        summary={"key_insight": "Tickets increasing"},
+        generated_at=_D_JAN15_1030,
+        ticket_count=150,
+        date_range=(_D_JAN1, _D_JAN31),
+        analysis_duration=45.2,
+        metadata={"analysis_version": "1.0"}
+    )
+
+
+@pytest.fixture(scope="class")
+def result_with_metrics() -> AnalysisResult:
+    """Read-only result holding a couple of metrics, shared per class."""
+    return AnalysisResult(metrics={"total_tickets": 100, "avg_resolution_time": 24.5})
+
+
+@pytest.fixture(scope="class")
+def empty_result() -> AnalysisResult:
+    """Read-only result with no metrics, shared per class."""
+    return AnalysisResult(metrics={})
+
+
 class TestSearchCriteria:
     """Test cases for SearchCriteria dataclass."""
     
@@ -35,75 +141,45 @@ class TestSearchCriteria:
         assert criteria.max_results == 1000
         assert criteria.offset == 0
     
-    def test_initialization_with_all_fields(self) -> None:
+    def test_initialization_with_all_fields(self, full_criteria: SearchCriteria) -> None:
         """Test SearchCriteria with all fields populated."""
-        created_after = datetime(2024, 1, 1)
-        created_before = datetime(2024, 1, 31)
-        updated_after = datetime(2024, 1, 15)
-        updated_before = datetime(2024, 1, 30)
-        
-        criteria = SearchCriteria(
-            status=[TicketStatus.OPEN, TicketStatus.IN_PROGRESS],
-            severity=[TicketSeverity.SEV_1, TicketSeverity.SEV_2],
-            assignee="testuser",
-            resolver_group="Test Team",
-            created_after=created_after,
-            created_before=created_before,
-            updated_after=updated_after,
-            updated_before=updated_before,
-            tags=["urgent", "bug"],
-            search_text="authentication error",
-            max_results=500,
-            offset=10
-        )
+        criteria = full_criteria
         
         assert criteria.status == [TicketStatus.OPEN, TicketStatus.IN_PROGRESS]
         assert criteria.severity == [TicketSeverity.SEV_1, TicketSeverity.SEV_2]
         assert criteria.assignee == "testuser"
         assert criteria.resolver_group == "Test Team"
-        assert criteria.created_after == created_after
-        assert criteria.created_before == created_before
-        assert criteria.updated_after == updated_after
-        assert criteria.updated_before == updated_before
+        assert criteria.created_after == _D_JAN1_1000
+        assert criteria.created_before == _D_JAN31_1800
+        assert criteria.updated_after == _D_JAN15
+        assert criteria.updated_before == _D_JAN30
         assert criteria.tags == ["urgent", "bug"]
         assert criteria.search_text == "authentication error"
         assert criteria.max_results == 500
         assert criteria.offset == 10
     
-    def test_to_dict_with_all_fields(self) -> None:
+    def test_to_dict_with_all_fields(self, full_criteria: SearchCriteria) -> None:
         """Test converting SearchCriteria to dictionary with all fields."""
-        created_after = datetime(2024, 1, 1, 10, 0, 0)
-        created_before = datetime(2024, 1, 31, 18, 0, 0)
-        
-        criteria = SearchCriteria(
-            status=[TicketStatus.OPEN, TicketStatus.RESOLVED],
-            severity=[TicketSeverity.SEV_2],
-            assignee="testuser",
-            resolver_group="Test Team",
-            created_after=created_after,
-            created_before=created_before,
-            tags=["urgent"],
-            search_text="login issue",
-            max_results=100,
-            offset=20
-        )
-        
-        result = criteria.to_dict()
+        result = full_criteria.to_dict()
         
         expected = {
-            "status": ["Open", "Resolved"],
-            "severity": ["SEV_2"],
+            "status": ["Open", "In Progress"],
+            "severity": ["SEV_1", "SEV_2"],
             "assignee": "testuser",
             "resolver_group": "Test Team",
             "created_after": "2024-01-01T10:00:00",
             "created_before": "2024-01-31T18:00:00",
-            "tags": ["urgent"],
-            "search_text": "login issue",
-            "max_results": 100,
-            "offset": 20
+            "updated_after": "2024-01-15T00:00:00",
+            "updated_before": "2024-01-30T00:00:00",
+            "tags": ["urgent", "bug"],
+            "search_text": "authentication error",
+            "max_results": 500,
+            "offset": 10
         }
         
         assert result == expected
+        assert tuple(result["status"]) == _EXPECTED_STATUS_STRS
+        assert tuple(result["severity"]) == _EXPECTED_SEVERITY_STRS
     
     def test_to_dict_with_minimal_fields(self) -> None:
         """Test converting SearchCriteria to dictionary with minimal fields."""
@@ -118,36 +194,24 @@ class TestSearchCriteria:
         
         assert result == expected
     
-    def test_to_mcp_query_with_all_fields(self) -> None:
+    @pytest.mark.parametrize("clause", [
+        'status:("Open" OR "In Progress")',
+        'severity:("SEV_1" OR "SEV_2")',
+        'assignee:"testuser"',
+        'resolver_group:"Test Team"',
+        'created_date:[2024-01-01T10:00:00 TO *]',
+        'created_date:[* TO 2024-01-31T18:00:00]',
+        '(title:"authentication error" OR description:"authentication error")',
+    ])
+    def test_to_mcp_query_with_all_fields(self, full_query_clauses: frozenset[str],
+                                          clause: str) -> None:
         """Test converting SearchCriteria to MCP Lucene query with all fields."""
-        created_after = datetime(2024, 1, 1, 10, 0, 0)
-        created_before = datetime(2024, 1, 31, 18, 0, 0)
-        
-        criteria = SearchCriteria(
-            status=[TicketStatus.OPEN, TicketStatus.IN_PROGRESS],
-            severity=[TicketSeverity.SEV_1, TicketSeverity.SEV_2],
-            assignee="testuser",
-            resolver_group="Test Team",
-            created_after=created_after,
-            created_before=created_before,
-            tags=["urgent", "bug"],
-            search_text="authentication error"
-        )
-        
-        query = criteria.to_mcp_query()
-        
-        # Check that all expected parts are in the query
-        assert 'status:("Open" OR "In Progress")' in query
-        assert 'severity:("SEV_1" OR "SEV_2")' in query
-        assert 'assignee:"testuser"' in query
-        assert 'resolver_group:"Test Team"' in query
-        assert 'created_date:[2024-01-01T10:00:00 TO *]' in query
-        assert 'created_date:[* TO 2024-01-31T18:00:00]' in query
-        assert '(tags:"urgent" AND tags:"bug")' in query
-        assert '(title:"authentication error" OR description:"authentication error")' in query
-        
-        # Check that parts are joined with AND
-        assert " AND " in query
+        assert clause in full_query_clauses
+    
+    def test_to_mcp_query_groups_tags(self, full_query: str) -> None:
+        """Test that tag clauses are AND-ed inside their own group."""
+        # The tag group itself contains " AND ", so check it as a substring
+        assert '(tags:"urgent" AND tags:"bug")' in full_query
     
     def test_to_mcp_query_with_minimal_fields(self) -> None:
         """Test converting SearchCriteria to MCP query with minimal fields."""
@@ -165,14 +229,14 @@ class TestSearchCriteria:
         """Test that special characters in search text are escaped."""
         criteria = SearchCriteria(search_text='error "authentication" failed')
         query = criteria.to_mcp_query()
-        assert 'error \\"authentication\\" failed' in query
+        assert _ESCAPE_RE.search(query) is not None
     
     def test_validate_success(self) -> None:
         """Test successful validation of SearchCriteria."""
-        created_after = datetime(2024, 1, 1)
-        created_before = datetime(2024, 1, 31)
-        updated_after = datetime(2024, 1, 10)
-        updated_before = datetime(2024, 1, 20)
+        created_after = _D_JAN1
+        created_before = _D_JAN31
+        updated_after = _D_JAN10
+        updated_before = _D_JAN20
         
         criteria = SearchCriteria(
             max_results=100,
@@ -186,70 +250,31 @@ class TestSearchCriteria:
         # Should not raise any exception
         criteria.validate()
     
-    def test_validate_max_results_zero(self) -> None:
-        """Test validation fails for zero max_results."""
-        criteria = SearchCriteria(max_results=0)
-        
-        with pytest.raises(ValueError, match="max_results must be positive"):
-            criteria.validate()
-    
-    def test_validate_max_results_negative(self) -> None:
-        """Test validation fails for negative max_results."""
-        criteria = SearchCriteria(max_results=-1)
-        
-        with pytest.raises(ValueError, match="max_results must be positive"):
-            criteria.validate()
-    
-    def test_validate_max_results_too_large(self) -> None:
-        """Test validation fails for max_results exceeding limit."""
-        criteria = SearchCriteria(max_results=10001)
-        
-        with pytest.raises(ValueError, match="max_results cannot exceed 10000"):
-            criteria.validate()
-    
-    def test_validate_negative_offset(self) -> None:
-        """Test validation fails for negative offset."""
-        criteria = SearchCriteria(offset=-1)
-        
-        with pytest.raises(ValueError, match="offset cannot be negative"):
-            criteria.validate()
-    
-    def test_validate_invalid_created_date_range(self) -> None:
-        """Test validation fails when created_after >= created_before."""
-        created_after = datetime(2024, 1, 31)
-        created_before = datetime(2024, 1, 1)  # Before created_after
-        
-        criteria = SearchCriteria(
-            created_after=created_after,
-            created_before=created_before
-        )
-        
-        with pytest.raises(ValueError, match="created_after must be before created_before"):
-            criteria.validate()
-    
-    def test_validate_equal_created_dates(self) -> None:
-        """Test validation fails when created dates are equal."""
-        same_date = datetime(2024, 1, 15)
-        
-        criteria = SearchCriteria(
-            created_after=same_date,
-            created_before=same_date
-        )
-        
-        with pytest.raises(ValueError, match="created_after must be before created_before"):
-            criteria.validate()
-    
-    def test_validate_invalid_updated_date_range(self) -> None:
-        """Test validation fails when updated_after >= updated_before."""
-        updated_after = datetime(2024, 1, 20)
-        updated_before = datetime(2024, 1, 10)  # Before updated_after
-        
-        criteria = SearchCriteria(
-            updated_after=updated_after,
-            updated_before=updated_before
-        )
-        
-        with pytest.raises(ValueError, match="updated_after must be before updated_before"):
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"max_results": 0}, "max_results must be positive"),
+        ({"max_results": -1}, "max_results must be positive"),
+        ({"max_results": 10001}, "max_results cannot exceed 10000"),
+        ({"offset": -1}, "offset cannot be negative"),
+        ({"created_after": _D_JAN31, "created_before": _D_JAN1},
+         "created_after must be before created_before"),
+        ({"created_after": _D_JAN15, "created_before": _D_JAN15},
+         "created_after must be before created_before"),
+        ({"updated_after": _D_JAN20, "updated_before": _D_JAN10},
+         "updated_after must be before updated_before"),
+    ], ids=[
+        "max_results_zero",
+        "max_results_negative",
+        "max_results_too_large",
+        "negative_offset",
+        "invalid_created_date_range",
+        "equal_created_dates",
+        "invalid_updated_date_range",
+    ])
+    def test_validate_errors(self, kwargs: dict[str, Any], match: str) -> None:
+        """Test validation fails for out-of-range or inverted criteria."""
+        criteria = SearchCriteria(**kwargs)
+        
+        with pytest.raises(ValueError, match=match):
             criteria.validate()
 
 
@@ -270,63 +295,41 @@ class TestAnalysisResult:
         assert result.analysis_duration is None
         assert result.metadata == {}
     
-    def test_initialization_with_all_fields(self) -> None:
+    def test_initialization_with_all_fields(self, full_result: AnalysisResult) -> None:
         """Test AnalysisResult with all fields populated."""
-        metrics = {"total_tickets": 150}
-        trends = {"weekly_trend": [1, 2, 3, 4]}
-        summary = {"key_insight": "Tickets increasing"}
-        generated_at = datetime(2024, 1, 15, 10, 30, 0)
-        date_range = (datetime(2024, 1, 1), datetime(2024, 1, 31))
-        metadata = {"analysis_version": "1.0"}
-        
-        result = AnalysisResult(
-            metrics=metrics,
-            trends=trends,
-            summary=summary,
-            generated_at=generated_at,
-            ticket_count=150,
-            date_range=date_range,
-            analysis_duration=45.2,
-            metadata=metadata
-        )
+        result = full_result
         
-        assert result.metrics == metrics
-        assert result.trends == trends
-        assert result.summary == summary
-        assert result.generated_at == generated_at
+        assert result.metrics == {"total_tickets": 150}
+        assert result.trends == {"weekly_trend": [1, 2, 3, 4]}
+        assert result.summary == {"key_insight": "Tickets increasing"}
+        assert result.generated_at == _D_JAN15_1030
         assert result.ticket_count == 150
-        assert result.date_range == date_range
+        assert result.date_range == (_D_JAN1, _D_JAN31)
         assert result.analysis_duration == 45.2
-        assert result.metadata == metadata
+        assert result.metadata == {"analysis_version": "1.0"}
     
-    def test_get_metric_existing(self) -> None:
+    def test_get_metric_existing(self, result_with_metrics: AnalysisResult) -> None:
         """Test getting an existing metric."""
-        metrics = {"total_tickets": 100, "avg_resolution_time": 24.5}
-        result = AnalysisResult(metrics=metrics)
+        result = result_with_metrics
         
         assert result.get_metric("total_tickets") == 100
         assert result.get_metric("avg_resolution_time") == 24.5
     
-    def test_get_metric_nonexistent_with_default(self) -> None:
+    def test_get_metric_nonexistent_with_default(self, empty_result: AnalysisResult) -> None:
         """Test getting a nonexistent metric with default value."""
-        result = AnalysisResult(metrics={})
+        result = empty_result
         
         assert result.get_metric("nonexistent", "default") == "default"
         assert result.get_metric("nonexistent", 0) == 0
     
-    def test_get_metric_nonexistent_without_default(self) -> None:
+    def test_get_metric_nonexistent_without_default(self, empty_result: AnalysisResult) -> None:
         """Test getting a nonexistent metric without default value."""
-        result = AnalysisResult(metrics={})
-        
-        assert result.get_metric("nonexistent") is None
+        assert empty_result.get_metric("nonexistent") is None
     
-    def test_has_metric(self) -> None:
+    def test_has_metric(self, result_with_metrics: AnalysisResult) -> None:
         """Test checking if metrics exist."""
-        metrics = {"total_tickets": 100}
-        result = AnalysisResult(metrics=metrics)
-        
-        assert result.has_metric("total_tickets") is True
-        assert result.has_metric("nonexistent") is False
+        assert result_with_metrics.has_metric("total_tickets") is True
+        assert result_with_metrics.has_metric("nonexistent") is False
     
     def test_get_trend_existing(self) -> None:
         """Test getting an existing trend."""
@@ -363,37 +366,19 @@ class TestAnalysisResult:
         assert result.trends["new_trend"] == [1, 2, 3]
         assert result.trends["another_trend"] == {"data": "value"}
     
-    def test_to_dict_conversion(self) -> None:
+    def test_to_dict_conversion(self, full_result: AnalysisResult) -> None:
         """Test converting AnalysisResult to dictionary."""
-        metrics = {"total_tickets": 100}
-        trends = {"weekly": [1, 2, 3]}
-        summary = {"insight": "test"}
-        generated_at = datetime(2024, 1, 15, 10, 30, 0)
-        date_range = (datetime(2024, 1, 1), datetime(2024, 1, 31))
-        metadata = {"version": "1.0"}
-        
-        result = AnalysisResult(
-            metrics=metrics,
-            trends=trends,
-            summary=summary,
-            generated_at=generated_at,
-            ticket_count=100,
-            date_range=date_range,
-            analysis_duration=30.5,
-            metadata=metadata
-        )
-        
-        dict_result = result.to_dict()
+        dict_result = full_result.to_dict()
         
         expected = {
-            "metrics": metrics,
-            "trends": trends,
-            "summary": summary,
+            "metrics": {"total_tickets": 150},
+            "trends": {"weekly_trend": [1, 2, 3, 4]},
+            "summary": {"key_insight": "Tickets increasing"},
             "generated_at": "2024-01-15T10:30:00",
-            "ticket_count": 100,
-            "date_range": date_range,
-            "analysis_duration": 30.5,
-            "metadata": metadata
+            "ticket_count": 150,
+            "date_range": (_D_JAN1, _D_JAN31),
+            "analysis_duration": 45.2,
+            "metadata": {"analysis_version": "1.0"}
         }
         
         assert dict_result == expected
@@ -447,7 +432,7 @@ class TestTrendPoint:
     
     def test_initialization_with_required_fields(self) -> None:
         """Test TrendPoint with required fields only."""
-        timestamp = datetime(2024, 1, 15, 10, 0, 0)
+        timestamp = _D_JAN15_1000
         point = TrendPoint(timestamp=timestamp, value=42.5)
         
         assert point.timestamp == timestamp
@@ -457,7 +442,7 @@ class TestTrendPoint:
     
     def test_initialization_with_all_fields(self) -> None:
         """Test TrendPoint with all fields populated."""
-        timestamp = datetime(2024, 1, 15, 10, 0, 0)
+        timestamp = _D_JAN15_1000
         metadata = {"source": "api", "confidence": 0.95}
         
         point = TrendPoint(
@@ -474,8 +459,8 @@ class TestTrendPoint:
     
     def test_default_metadata_independence(self) -> None:
         """Test that default metadata dictionaries are independent."""
-        point1 = TrendPoint(datetime.now(), 1.0)
-        point2 = TrendPoint(datetime.now(), 2.0)
+        point1 = TrendPoint(_D_JAN1, 1.0)
+        point2 = TrendPoint(_D_JAN2, 2.0)
         
         point1.metadata["key"] = "value1"
         point2.metadata["key"] = "value2"
@@ -490,8 +475,8 @@ class TestTrendAnalysis:
     def test_initialization_with_required_fields(self) -> None:
         """Test TrendAnalysis with required fields only."""
         data_points = [
-            TrendPoint(datetime(2024, 1, 1), 10.0),
-            TrendPoint(datetime(2024, 1, 2), 15.0)
+            TrendPoint(_D_JAN1, 10.0),
+            TrendPoint(_D_JAN2, 15.0)
         ]
         
         trend = TrendAnalysis(
@@ -509,9 +494,9 @@ class TestTrendAnalysis:
     
     def test_initialization_with_all_fields(self) -> None:
         """Test TrendAnalysis with all fields populated."""
-        data_points = [TrendPoint(datetime(2024, 1, 1), 10.0)]
-        period_start = datetime(2024, 1, 1)
-        period_end = datetime(2024, 1, 31)
+        data_points = [TrendPoint(_D_JAN1, 10.0)]
+        period_start = _D_JAN1
+        period_end = _D_JAN31
         
         trend = TrendAnalysis(
             metric_name="resolution_time",
@@ -535,8 +520,8 @@ class TestTrendAnalysis:
         """Test adding data points to trend analysis."""
         trend = TrendAnalysis(metric_name="test", data_points=[])
         
-        timestamp1 = datetime(2024, 1, 1, 10, 0, 0)
-        timestamp2 = datetime(2024, 1, 2, 10, 0, 0)
+        timestamp1 = _D_JAN1_1000
+        timestamp2 = _D_JAN2_1000
         
         trend.add_point(timestamp1, 100.0)
         trend.add_point(timestamp2, 150.0, "Peak")
@@ -553,18 +538,6 @@ class TestTrendAnalysis:
         assert point2.value == 150.0
         assert point2.label == "Peak"
     
-    def test_get_latest_value_with_data(self) -> None:
-        """Test getting latest value when data points exist."""
-        trend = TrendAnalysis(metric_name="test", data_points=[])
-        
-        # Add points in non-chronological order
-        trend.add_point(datetime(2024, 1, 1), 10.0)
-        trend.add_point(datetime(2024, 1, 3), 30.0)  # Latest
-        trend.add_point(datetime(2024, 1, 2), 20.0)
-        
-        latest = trend.get_latest_value()
-        assert latest == 30.0  # Should be the value with latest timestamp
-    
     def test_get_latest_value_empty_data(self) -> None:
         """Test getting latest value when no data points exist."""
         trend = TrendAnalysis(metric_name="test", data_points=[])
@@ -572,35 +545,11 @@ class TestTrendAnalysis:
         latest = trend.get_latest_value()
         assert latest is None
     
-    def test_get_value_range_with_data(self) -> None:
-        """Test getting value range when data points exist."""
-        trend = TrendAnalysis(metric_name="test", data_points=[])
-        
-        trend.add_point(datetime(2024, 1, 1), 15.0)
-        trend.add_point(datetime(2024, 1, 2), 5.0)   # Min
-        trend.add_point(datetime(2024, 1, 3), 25.0)  # Max
-        trend.add_point(datetime(2024, 1, 4), 10.0)
-        
-        min_val, max_val = trend.get_value_range()
-        assert min_val == 5.0
-        assert max_val == 25.0
-    
     def test_get_value_range_empty_data(self) -> None:
         """Test getting value range when no data points exist."""
         trend = TrendAnalysis(metric_name="test", data_points=[])
         
-        min_val, max_val = trend.get_value_range()
-        assert min_val is None
-        assert max_val is None
-    
-    def test_get_value_range_single_point(self) -> None:
-        """Test getting value range with single data point."""
-        trend = TrendAnalysis(metric_name="test", data_points=[])
-        trend.add_point(datetime(2024, 1, 1), 42.0)
-        
-        min_val, max_val = trend.get_value_range()
-        assert min_val == 42.0
-        assert max_val == 42.0
+        assert trend.get_value_range() == (None, None)
     
     def test_trend_direction_values(self) -> None:
         """Test valid trend direction values."""
@@ -614,55 +563,21 @@ class TestTrendAnalysis:
             )
             assert trend.trend_direction == direction
     
-    def test_edge_case_negative_values(self) -> None:
-        """Test handling of negative values in trend points."""
+    @pytest.mark.parametrize("points,lo,hi,latest", _TREND_CASES, ids=_TREND_CASE_IDS)
+    def test_value_range_and_latest(self, points: list[tuple[datetime, float]],
+                                    lo: float, hi: float, latest: float) -> None:
+        """Test value range and latest value across representative point sets."""
         trend = TrendAnalysis(metric_name="test", data_points=[])
+        for timestamp, value in points:
+            trend.add_point(timestamp, value)
         
-        trend.add_point(datetime(2024, 1, 1), -10.0)
-        trend.add_point(datetime(2024, 1, 2), -5.0)
-        trend.add_point(datetime(2024, 1, 3), 0.0)
-        trend.add_point(datetime(2024, 1, 4), 5.0)
-        
-        min_val, max_val = trend.get_value_range()
-        assert min_val == -10.0
-        assert max_val == 5.0
-        
-        latest = trend.get_latest_value()
-        assert latest == 5.0
-    
-    def test_edge_case_zero_values(self) -> None:
-        """Test handling of zero values in trend points."""
-        trend = TrendAnalysis(metric_name="test", data_points=[])
-        
-        trend.add_point(datetime(2024, 1, 1), 0.0)
-        trend.add_point(datetime(2024, 1, 2), 0.0)
-        
-        min_val, max_val = trend.get_value_range()
-        assert min_val == 0.0
-        assert max_val == 0.0
-        
-        latest = trend.get_latest_value()
-        assert latest == 0.0
-    
-    def test_edge_case_very_large_values(self) -> None:
-        """Test handling of very large values."""
-        trend = TrendAnalysis(metric_name="test", data_points=[])
-        
-        large_value = 1e10
-        trend.add_point(datetime(2024, 1, 1), large_value)
-        
-        latest = trend.get_latest_value()
-        assert latest == large_value
-        
-        min_val, max_val = trend.get_value_range()
-        assert min_val == large_value
-        assert max_val == large_value
+        assert (trend.get_value_range(), trend.get_latest_value()) == ((lo, hi), latest)
     
     def test_edge_case_same_timestamps(self) -> None:
         """Test handling of data points with same timestamps."""
         trend = TrendAnalysis(metric_name="test", data_points=[])
         
-        same_time = datetime(2024, 1, 1, 10, 0, 0)
+        same_time = _D_JAN1_1000
         trend.add_point(same_time, 10.0)
         trend.add_point(same_time, 20.0)  # Same timestamp, different value
         
@@ -670,6 +585,4 @@ class TestTrendAnalysis:
         latest = trend.get_latest_value()
         assert latest in [10.0, 20.0]  # Either could be "latest" with same timestamp
         
-        min_val, max_val = trend.get_value_range()
-        assert min_val == 10.0
-        assert max_val == 20.0
\ No newline at end of file
+        assert trend.get_value_range() == (10.0, 20.0)
\ No newline at end of file
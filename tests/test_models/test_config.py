@@ -6,9 +6,14 @@ and ApplicationConfig, covering dataclass instantiation, validation,
 conversions, and edge cases.
 """
 
+import copy
+import dataclasses
+import functools
+import re
+
 import pytest
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Pattern, Union
 
 from ticket_analyzer.models.config import (
     OutputFormat, LogLevel, ReportConfig, AuthConfig, MCPConfig,
@@ -16,22 +21,136 @@ from ticket_analyzer.models.config import (
 )
 
 
+# Every test here is "fast" except the TestFromDictScaling benchmarks, which
+# are additionally marked "slow". Run the quick loop with -m "fast and not slow".
+pytestmark = pytest.mark.fast
+
+
+# Canonical validation messages, compiled once per (field, limit) and reused
+@functools.lru_cache(maxsize=None)
+def _must_be_positive(name: str) -> Pattern[str]:
+    return re.compile(f"{name} must be positive")
+
+
+@functools.lru_cache(maxsize=None)
+def _cannot_be_negative(name: str) -> Pattern[str]:
+    return re.compile(f"{name} cannot be negative")
+
+
+@functools.lru_cache(maxsize=None)
+def _cannot_exceed(name: str, limit: int) -> Pattern[str]:
+    return re.compile(f"{name} cannot exceed {limit}")
+
+
+_EXPECTED_EXTENSIONS = {
+    OutputFormat.TABLE: ".txt",
+    OutputFormat.JSON: ".json",
+    OutputFormat.CSV: ".csv",
+    OutputFormat.HTML: ".html",
+    OutputFormat.YAML: ".yaml"
+}
+
+
+_ALL_OUTPUT_FORMAT_VALUES = frozenset(fmt.value for fmt in OutputFormat)
+_ALL_LOG_LEVEL_VALUES = frozenset(level.value for level in LogLevel)
+
+# (field, default) pairs for each configuration dataclass
+_REPORTCONFIG_DEFAULTS = [
+    ("format", OutputFormat.TABLE),
+    ("output_path", None),
+    ("include_charts", True),
+    ("color_output", True),
+    ("template_name", None),
+    ("sanitize_output", True),
+    ("max_results_display", 100),
+    ("show_progress", True),
+    ("verbose", False),
+    ("theme", "auto"),
+]
+_AUTHCONFIG_DEFAULTS = [
+    ("timeout_seconds", 60),
+    ("max_retry_attempts", 3),
+    ("check_interval_seconds", 300),
+    ("session_duration_hours", 8),
+    ("auto_refresh", True),
+    ("require_auth", True),
+    ("auth_method", "midway"),
+    ("cache_credentials", False),
+]
+_MCPCONFIG_DEFAULTS = [
+    ("server_command", ["node", "mcp-server.js"]),
+    ("connection_timeout", 30),
+    ("request_timeout", 60),
+    ("max_retries", 3),
+    ("retry_delay", 1.0),
+    ("circuit_breaker_threshold", 5),
+    ("circuit_breaker_timeout", 60),
+    ("enable_logging", False),
+]
+_LOGGINGCONFIG_DEFAULTS = [
+    ("level", LogLevel.INFO),
+    ("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+    ("file_path", None),
+    ("max_file_size", 10 * 1024 * 1024),  # 10MB
+    ("backup_count", 5),
+    ("sanitize_logs", True),
+    ("include_timestamps", True),
+    ("include_caller_info", False),
+]
+_APPLICATIONCONFIG_DEFAULTS = [
+    ("data_dir", None),
+    ("config_dir", None),
+    ("cache_dir", None),
+    ("temp_dir", None),
+    ("debug_mode", False),
+    ("max_concurrent_requests", 10),
+]
+
+
+def _getpath(obj: Any, path: str) -> Any:
+    """Resolve a dotted attribute path such as ``"auth.timeout_seconds"``."""
+    return functools.reduce(getattr, path.split("."), obj)
+
+
+_FULL_FROM_DICT_DATA = {
+    "auth": {
+        "timeout_seconds": 90,
+        "auth_method": "kerberos"
+    },
+    "report": {
+        "format": "json",
+        "max_results_display": 200
+    },
+    "mcp": {
+        "server_command": ["python", "server.py"],
+        "connection_timeout": 45
+    },
+    "logging": {
+        "level": "DEBUG",
+        "file_path": "/tmp/app.log"
+    },
+    "debug_mode": True,
+    "max_concurrent_requests": 20
+}
+
+
 class TestOutputFormat:
     """Test cases for OutputFormat enum."""
     
     def test_enum_values(self) -> None:
         """Test that all expected output format values exist."""
-        expected_values = {"table", "json", "csv", "html", "yaml"}
-        actual_values = {fmt.value for fmt in OutputFormat}
-        assert actual_values == expected_values
-    
-    def test_enum_creation_from_string(self) -> None:
+        assert _ALL_OUTPUT_FORMAT_VALUES == {"table", "json", "csv", "html", "yaml"}
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("table", OutputFormat.TABLE),
+        ("json", OutputFormat.JSON),
+        ("csv", OutputFormat.CSV),
+        ("html", OutputFormat.HTML),
+        ("yaml", OutputFormat.YAML),
+    ])
+    def test_enum_creation_from_string(self, value: str, expected: OutputFormat) -> None:
         """Test creating OutputFormat from string values."""
-        assert OutputFormat("table") == OutputFormat.TABLE
-        assert OutputFormat("json") == OutputFormat.JSON
-        assert OutputFormat("csv") == OutputFormat.CSV
-        assert OutputFormat("html") == OutputFormat.HTML
-        assert OutputFormat("yaml") == OutputFormat.YAML
+        assert OutputFormat(value) is expected
     
     def test_enum_invalid_value(self) -> None:
         """Test that invalid format values raise ValueError."""
@@ -52,17 +171,18 @@ class TestLogLevel:
     
     def test_enum_values(self) -> None:
         """Test that all expected log level values exist."""
-        expected_values = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        actual_values = {level.value for level in LogLevel}
-        assert actual_values == expected_values
-    
-    def test_enum_creation_from_string(self) -> None:
+        assert _ALL_LOG_LEVEL_VALUES == {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("DEBUG", LogLevel.DEBUG),
+        ("INFO", LogLevel.INFO),
+        ("WARNING", LogLevel.WARNING),
+        ("ERROR", LogLevel.ERROR),
+        ("CRITICAL", LogLevel.CRITICAL),
+    ])
+    def test_enum_creation_from_string(self, value: str, expected: LogLevel) -> None:
         """Test creating LogLevel from string values."""
-        assert LogLevel("DEBUG") == LogLevel.DEBUG
-        assert LogLevel("INFO") == LogLevel.INFO
-        assert LogLevel("WARNING") == LogLevel.WARNING
-        assert LogLevel("ERROR") == LogLevel.ERROR
-        assert LogLevel("CRITICAL") == LogLevel.CRITICAL
+        assert LogLevel(value) is expected
     
     def test_enum_invalid_value(self) -> None:
         """Test that invalid log level values raise ValueError."""
@@ -73,20 +193,12 @@ class TestLogLevel:
 class TestReportConfig:
     """Test cases for ReportConfig dataclass."""
     
-    def test_default_initialization(self) -> None:
-        """Test ReportConfig with default values."""
-        config = ReportConfig()
-        
-        assert config.format == OutputFormat.TABLE
-        assert config.output_path is None
-        assert config.include_charts is True
-        assert config.color_output is True
-        assert config.template_name is None
-        assert config.sanitize_output is True
-        assert config.max_results_display == 100
-        assert config.show_progress is True
-        assert config.verbose is False
-        assert config.theme == "auto"
+    @pytest.mark.parametrize("attr,expected", _REPORTCONFIG_DEFAULTS)
+    def test_default(self, attr: str, expected: Any, default_report_config: ReportConfig) -> None:
+        """Test ReportConfig default for a single field."""
+        actual = getattr(default_report_config, attr)
+        assert actual == expected
+        assert type(actual) is type(expected)
     
     def test_initialization_with_all_fields(self) -> None:
         """Test ReportConfig with all fields populated."""
@@ -103,7 +215,7 @@ class TestReportConfig:
             theme="dark"
         )
         
-        assert config.format == OutputFormat.JSON
+        assert config.format is OutputFormat.JSON
         assert config.output_path == "/tmp/report.json"
         assert config.include_charts is False
         assert config.color_output is False
@@ -125,54 +237,37 @@ class TestReportConfig:
         # Should not raise any exception
         config.validate()
     
-    def test_validate_max_results_display_zero(self) -> None:
-        """Test validation fails for zero max_results_display."""
-        config = ReportConfig(max_results_display=0)
-        
-        with pytest.raises(ValueError, match="max_results_display must be positive"):
-            config.validate()
-    
-    def test_validate_max_results_display_negative(self) -> None:
-        """Test validation fails for negative max_results_display."""
-        config = ReportConfig(max_results_display=-1)
-        
-        with pytest.raises(ValueError, match="max_results_display must be positive"):
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"max_results_display": 0}, _must_be_positive("max_results_display")),
+        ({"max_results_display": -1}, _must_be_positive("max_results_display")),
+        ({"max_results_display": 10001}, _cannot_exceed("max_results_display", 10000)),
+        ({"theme": "invalid_theme"}, "theme must be 'light', 'dark', or 'auto'"),
+    ], ids=[
+        "max_results_display_zero",
+        "max_results_display_negative",
+        "max_results_display_too_large",
+        "invalid_theme",
+    ])
+    def test_validate_rejects(self, kwargs: Dict[str, Any],
+                              match: Union[str, Pattern[str]]) -> None:
+        """Test validation fails for out-of-range ReportConfig values."""
+        config = ReportConfig(**kwargs)
+        
+        with pytest.raises(ValueError, match=match):
             config.validate()
     
-    def test_validate_max_results_display_too_large(self) -> None:
-        """Test validation fails for max_results_display exceeding limit."""
-        config = ReportConfig(max_results_display=10001)
-        
-        with pytest.raises(ValueError, match="max_results_display cannot exceed 10000"):
-            config.validate()
-    
-    def test_validate_output_path_directory(self, tmp_path: Path) -> None:
+    def test_validate_output_path_directory(self, shared_dir: Path) -> None:
         """Test validation fails when output_path is a directory."""
-        config = ReportConfig(output_path=str(tmp_path))
+        config = ReportConfig(output_path=str(shared_dir))
         
         with pytest.raises(ValueError, match="output_path cannot be a directory"):
             config.validate()
     
-    def test_validate_invalid_theme(self) -> None:
-        """Test validation fails for invalid theme."""
-        config = ReportConfig(theme="invalid_theme")
-        
-        with pytest.raises(ValueError, match="theme must be 'light', 'dark', or 'auto'"):
-            config.validate()
-    
-    def test_get_output_extension(self) -> None:
+    @pytest.mark.parametrize("format_type,expected_ext", list(_EXPECTED_EXTENSIONS.items()))
+    def test_get_output_extension(self, format_type: OutputFormat, expected_ext: str) -> None:
         """Test getting appropriate file extensions for different formats."""
-        extensions = {
-            OutputFormat.TABLE: ".txt",
-            OutputFormat.JSON: ".json",
-            OutputFormat.CSV: ".csv",
-            OutputFormat.HTML: ".html",
-            OutputFormat.YAML: ".yaml"
-        }
-        
-        for format_type, expected_ext in extensions.items():
-            config = ReportConfig(format=format_type)
-            assert config.get_output_extension() == expected_ext
+        config = ReportConfig(format=format_type)
+        assert config.get_output_extension() == expected_ext
     
     def test_to_dict_conversion(self) -> None:
         """Test converting ReportConfig to dictionary."""
@@ -205,18 +300,12 @@ class TestReportConfig:
 class TestAuthConfig:
     """Test cases for AuthConfig dataclass."""
     
-    def test_default_initialization(self) -> None:
-        """Test AuthConfig with default values."""
-        config = AuthConfig()
-        
-        assert config.timeout_seconds == 60
-        assert config.max_retry_attempts == 3
-        assert config.check_interval_seconds == 300
-        assert config.session_duration_hours == 8
-        assert config.auto_refresh is True
-        assert config.require_auth is True
-        assert config.auth_method == "midway"
-        assert config.cache_credentials is False
+    @pytest.mark.parametrize("attr,expected", _AUTHCONFIG_DEFAULTS)
+    def test_default(self, attr: str, expected: Any, default_auth_config: AuthConfig) -> None:
+        """Test AuthConfig default for a single field."""
+        actual = getattr(default_auth_config, attr)
+        assert actual == expected
+        assert type(actual) is type(expected)
     
     def test_initialization_with_all_fields(self) -> None:
         """Test AuthConfig with all fields populated."""
@@ -253,67 +342,33 @@ class TestAuthConfig:
         # Should not raise any exception
         config.validate()
     
-    def test_validate_timeout_seconds_zero(self) -> None:
-        """Test validation fails for zero timeout_seconds."""
-        config = AuthConfig(timeout_seconds=0)
-        
-        with pytest.raises(ValueError, match="timeout_seconds must be positive"):
-            config.validate()
-    
-    def test_validate_timeout_seconds_negative(self) -> None:
-        """Test validation fails for negative timeout_seconds."""
-        config = AuthConfig(timeout_seconds=-1)
-        
-        with pytest.raises(ValueError, match="timeout_seconds must be positive"):
-            config.validate()
-    
-    def test_validate_timeout_seconds_too_large(self) -> None:
-        """Test validation fails for timeout_seconds exceeding limit."""
-        config = AuthConfig(timeout_seconds=301)
-        
-        with pytest.raises(ValueError, match="timeout_seconds cannot exceed 300"):
-            config.validate()
-    
-    def test_validate_max_retry_attempts_negative(self) -> None:
-        """Test validation fails for negative max_retry_attempts."""
-        config = AuthConfig(max_retry_attempts=-1)
-        
-        with pytest.raises(ValueError, match="max_retry_attempts cannot be negative"):
-            config.validate()
-    
-    def test_validate_max_retry_attempts_too_large(self) -> None:
-        """Test validation fails for max_retry_attempts exceeding limit."""
-        config = AuthConfig(max_retry_attempts=11)
-        
-        with pytest.raises(ValueError, match="max_retry_attempts cannot exceed 10"):
-            config.validate()
-    
-    def test_validate_check_interval_seconds_zero(self) -> None:
-        """Test validation fails for zero check_interval_seconds."""
-        config = AuthConfig(check_interval_seconds=0)
-        
-        with pytest.raises(ValueError, match="check_interval_seconds must be positive"):
-            config.validate()
-    
-    def test_validate_session_duration_hours_zero(self) -> None:
-        """Test validation fails for zero session_duration_hours."""
-        config = AuthConfig(session_duration_hours=0)
-        
-        with pytest.raises(ValueError, match="session_duration_hours must be positive"):
-            config.validate()
-    
-    def test_validate_session_duration_hours_too_large(self) -> None:
-        """Test validation fails for session_duration_hours exceeding limit."""
-        config = AuthConfig(session_duration_hours=25)
-        
-        with pytest.raises(ValueError, match="session_duration_hours cannot exceed 24"):
-            config.validate()
-    
-    def test_validate_invalid_auth_method(self) -> None:
-        """Test validation fails for invalid auth_method."""
-        config = AuthConfig(auth_method="invalid_method")
-        
-        with pytest.raises(ValueError, match="auth_method must be 'midway', 'kerberos', or 'none'"):
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"timeout_seconds": 0}, _must_be_positive("timeout_seconds")),
+        ({"timeout_seconds": -1}, _must_be_positive("timeout_seconds")),
+        ({"timeout_seconds": 301}, _cannot_exceed("timeout_seconds", 300)),
+        ({"max_retry_attempts": -1}, _cannot_be_negative("max_retry_attempts")),
+        ({"max_retry_attempts": 11}, _cannot_exceed("max_retry_attempts", 10)),
+        ({"check_interval_seconds": 0}, _must_be_positive("check_interval_seconds")),
+        ({"session_duration_hours": 0}, _must_be_positive("session_duration_hours")),
+        ({"session_duration_hours": 25}, _cannot_exceed("session_duration_hours", 24)),
+        ({"auth_method": "invalid_method"}, "auth_method must be 'midway', 'kerberos', or 'none'"),
+    ], ids=[
+        "timeout_seconds_zero",
+        "timeout_seconds_negative",
+        "timeout_seconds_too_large",
+        "max_retry_attempts_negative",
+        "max_retry_attempts_too_large",
+        "check_interval_seconds_zero",
+        "session_duration_hours_zero",
+        "session_duration_hours_too_large",
+        "invalid_auth_method",
+    ])
+    def test_validate_rejects(self, kwargs: Dict[str, Any],
+                              match: Union[str, Pattern[str]]) -> None:
+        """Test validation fails for out-of-range AuthConfig values."""
+        config = AuthConfig(**kwargs)
+        
+        with pytest.raises(ValueError, match=match):
             config.validate()
     
     def test_to_dict_conversion(self) -> None:
@@ -343,18 +398,12 @@ class TestAuthConfig:
 class TestMCPConfig:
     """Test cases for MCPConfig dataclass."""
     
-    def test_default_initialization(self) -> None:
-        """Test MCPConfig with default values."""
-        config = MCPConfig()
-        
-        assert config.server_command == ["node", "mcp-server.js"]
-        assert config.connection_timeout == 30
-        assert config.request_timeout == 60
-        assert config.max_retries == 3
-        assert config.retry_delay == 1.0
-        assert config.circuit_breaker_threshold == 5
-        assert config.circuit_breaker_timeout == 60
-        assert config.enable_logging is False
+    @pytest.mark.parametrize("attr,expected", _MCPCONFIG_DEFAULTS)
+    def test_default(self, attr: str, expected: Any, default_mcp_config: MCPConfig) -> None:
+        """Test MCPConfig default for a single field."""
+        actual = getattr(default_mcp_config, attr)
+        assert actual == expected
+        assert type(actual) is type(expected)
     
     def test_initialization_with_all_fields(self) -> None:
         """Test MCPConfig with all fields populated."""
@@ -395,71 +444,41 @@ class TestMCPConfig:
         # Should not raise any exception
         config.validate()
     
-    def test_validate_empty_server_command(self) -> None:
-        """Test validation fails for empty server_command."""
-        config = MCPConfig(server_command=[])
-        
-        with pytest.raises(ValueError, match="server_command cannot be empty"):
-            config.validate()
-    
-    def test_validate_connection_timeout_zero(self) -> None:
-        """Test validation fails for zero connection_timeout."""
-        config = MCPConfig(connection_timeout=0)
-        
-        with pytest.raises(ValueError, match="connection_timeout must be positive"):
-            config.validate()
-    
-    def test_validate_request_timeout_negative(self) -> None:
-        """Test validation fails for negative request_timeout."""
-        config = MCPConfig(request_timeout=-1)
-        
-        with pytest.raises(ValueError, match="request_timeout must be positive"):
-            config.validate()
-    
-    def test_validate_max_retries_negative(self) -> None:
-        """Test validation fails for negative max_retries."""
-        config = MCPConfig(max_retries=-1)
-        
-        with pytest.raises(ValueError, match="max_retries cannot be negative"):
-            config.validate()
-    
-    def test_validate_retry_delay_negative(self) -> None:
-        """Test validation fails for negative retry_delay."""
-        config = MCPConfig(retry_delay=-0.5)
-        
-        with pytest.raises(ValueError, match="retry_delay cannot be negative"):
-            config.validate()
-    
-    def test_validate_circuit_breaker_threshold_zero(self) -> None:
-        """Test validation fails for zero circuit_breaker_threshold."""
-        config = MCPConfig(circuit_breaker_threshold=0)
-        
-        with pytest.raises(ValueError, match="circuit_breaker_threshold must be positive"):
-            config.validate()
-    
-    def test_validate_circuit_breaker_timeout_zero(self) -> None:
-        """Test validation fails for zero circuit_breaker_timeout."""
-        config = MCPConfig(circuit_breaker_timeout=0)
-        
-        with pytest.raises(ValueError, match="circuit_breaker_timeout must be positive"):
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"server_command": []}, "server_command cannot be empty"),
+        ({"connection_timeout": 0}, _must_be_positive("connection_timeout")),
+        ({"request_timeout": -1}, _must_be_positive("request_timeout")),
+        ({"max_retries": -1}, _cannot_be_negative("max_retries")),
+        ({"retry_delay": -0.5}, _cannot_be_negative("retry_delay")),
+        ({"circuit_breaker_threshold": 0}, _must_be_positive("circuit_breaker_threshold")),
+        ({"circuit_breaker_timeout": 0}, _must_be_positive("circuit_breaker_timeout")),
+    ], ids=[
+        "empty_server_command",
+        "connection_timeout_zero",
+        "request_timeout_negative",
+        "max_retries_negative",
+        "retry_delay_negative",
+        "circuit_breaker_threshold_zero",
+        "circuit_breaker_timeout_zero",
+    ])
+    def test_validate_rejects(self, kwargs: Dict[str, Any],
+                              match: Union[str, Pattern[str]]) -> None:
+        """Test validation fails for out-of-range MCPConfig values."""
+        config = MCPConfig(**kwargs)
+        
+        with pytest.raises(ValueError, match=match):
             config.validate()
 
 
 class TestLoggingConfig:
     """Test cases for LoggingConfig dataclass."""
     
-    def test_default_initialization(self) -> None:
-        """Test LoggingConfig with default values."""
-        config = LoggingConfig()
-        
-        assert config.level == LogLevel.INFO
-        assert config.format == "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        assert config.file_path is None
-        assert config.max_file_size == 10 * 1024 * 1024  # 10MB
-        assert config.backup_count == 5
-        assert config.sanitize_logs is True
-        assert config.include_timestamps is True
-        assert config.include_caller_info is False
+    @pytest.mark.parametrize("attr,expected", _LOGGINGCONFIG_DEFAULTS)
+    def test_default(self, attr: str, expected: Any, default_logging_config: LoggingConfig) -> None:
+        """Test LoggingConfig default for a single field."""
+        actual = getattr(default_logging_config, attr)
+        assert actual == expected
+        assert type(actual) is type(expected)
     
     def test_initialization_with_all_fields(self) -> None:
         """Test LoggingConfig with all fields populated."""
@@ -474,7 +493,7 @@ class TestLoggingConfig:
             include_caller_info=True
         )
         
-        assert config.level == LogLevel.DEBUG
+        assert config.level is LogLevel.DEBUG
         assert config.format == "%(levelname)s: %(message)s"
         assert config.file_path == "/tmp/app.log"
         assert config.max_file_size == 5 * 1024 * 1024
@@ -494,30 +513,26 @@ class TestLoggingConfig:
         # Should not raise any exception
         config.validate()
     
-    def test_validate_max_file_size_zero(self) -> None:
-        """Test validation fails for zero max_file_size."""
-        config = LoggingConfig(max_file_size=0)
-        
-        with pytest.raises(ValueError, match="max_file_size must be positive"):
-            config.validate()
-    
-    def test_validate_max_file_size_negative(self) -> None:
-        """Test validation fails for negative max_file_size."""
-        config = LoggingConfig(max_file_size=-1)
-        
-        with pytest.raises(ValueError, match="max_file_size must be positive"):
-            config.validate()
-    
-    def test_validate_backup_count_negative(self) -> None:
-        """Test validation fails for negative backup_count."""
-        config = LoggingConfig(backup_count=-1)
-        
-        with pytest.raises(ValueError, match="backup_count cannot be negative"):
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"max_file_size": 0}, _must_be_positive("max_file_size")),
+        ({"max_file_size": -1}, _must_be_positive("max_file_size")),
+        ({"backup_count": -1}, _cannot_be_negative("backup_count")),
+    ], ids=[
+        "max_file_size_zero",
+        "max_file_size_negative",
+        "backup_count_negative",
+    ])
+    def test_validate_rejects(self, kwargs: Dict[str, Any],
+                              match: Union[str, Pattern[str]]) -> None:
+        """Test validation fails for out-of-range LoggingConfig values."""
+        config = LoggingConfig(**kwargs)
+        
+        with pytest.raises(ValueError, match=match):
             config.validate()
     
-    def test_validate_file_path_directory(self, tmp_path: Path) -> None:
+    def test_validate_file_path_directory(self, shared_dir: Path) -> None:
         """Test validation fails when file_path is a directory."""
-        config = LoggingConfig(file_path=str(tmp_path))
+        config = LoggingConfig(file_path=str(shared_dir))
         
         with pytest.raises(ValueError, match="file_path cannot be a directory"):
             config.validate()
@@ -526,20 +541,23 @@ class TestLoggingConfig:
 class TestApplicationConfig:
     """Test cases for ApplicationConfig dataclass."""
     
-    def test_default_initialization(self) -> None:
-        """Test ApplicationConfig with default values."""
-        config = ApplicationConfig()
-        
-        assert isinstance(config.auth, AuthConfig)
-        assert isinstance(config.report, ReportConfig)
-        assert isinstance(config.mcp, MCPConfig)
-        assert isinstance(config.logging, LoggingConfig)
-        assert config.data_dir is None
-        assert config.config_dir is None
-        assert config.cache_dir is None
-        assert config.temp_dir is None
-        assert config.debug_mode is False
-        assert config.max_concurrent_requests == 10
+    @pytest.mark.parametrize("attr,expected", _APPLICATIONCONFIG_DEFAULTS)
+    def test_default(self, attr: str, expected: Any, default_app_config: ApplicationConfig) -> None:
+        """Test ApplicationConfig default for a single field."""
+        actual = getattr(default_app_config, attr)
+        assert actual == expected
+        assert type(actual) is type(expected)
+    
+    @pytest.mark.parametrize("attr,expected_type", [
+        ("auth", AuthConfig),
+        ("report", ReportConfig),
+        ("mcp", MCPConfig),
+        ("logging", LoggingConfig),
+    ])
+    def test_default_subconfig_types(self, attr: str, expected_type: type,
+                                     default_app_config: ApplicationConfig) -> None:
+        """Test that each sub-configuration defaults to its own config type."""
+        assert isinstance(getattr(default_app_config, attr), expected_type)
     
     def test_initialization_with_all_fields(self) -> None:
         """Test ApplicationConfig with all fields populated."""
@@ -583,14 +601,14 @@ class TestApplicationConfig:
         """Test validation fails for zero max_concurrent_requests."""
         config = ApplicationConfig(max_concurrent_requests=0)
         
-        with pytest.raises(ValueError, match="max_concurrent_requests must be positive"):
+        with pytest.raises(ValueError, match=_must_be_positive("max_concurrent_requests")):
             config.validate()
     
     def test_validate_max_concurrent_requests_too_large(self) -> None:
         """Test validation fails for max_concurrent_requests exceeding limit."""
         config = ApplicationConfig(max_concurrent_requests=101)
         
-        with pytest.raises(ValueError, match="max_concurrent_requests cannot exceed 100"):
+        with pytest.raises(ValueError, match=_cannot_exceed("max_concurrent_requests", 100)):
             config.validate()
     
     def test_validate_propagates_to_subconfigs(self) -> None:
@@ -599,7 +617,7 @@ class TestApplicationConfig:
         invalid_auth = AuthConfig(timeout_seconds=-1)
         config = ApplicationConfig(auth=invalid_auth)
         
-        with pytest.raises(ValueError, match="timeout_seconds must be positive"):
+        with pytest.raises(ValueError, match=_must_be_positive("timeout_seconds")):
             config.validate()
     
     def test_to_dict_conversion(self) -> None:
@@ -609,104 +627,96 @@ class TestApplicationConfig:
             max_concurrent_requests=15
         )
         
-        result = config.to_dict()
-        
-        # Check that all sections are present
-        assert "auth" in result
-        assert "report" in result
-        assert "mcp" in result
-        assert "logging" in result
-        
-        # Check specific values
-        assert result["debug_mode"] is True
-        assert result["max_concurrent_requests"] == 15
-        assert result["data_dir"] is None
-        
-        # Check that sub-configs are properly converted
-        assert isinstance(result["auth"], dict)
-        assert isinstance(result["report"], dict)
-        assert isinstance(result["mcp"], dict)
-        assert isinstance(result["logging"], dict)
-    
-    def test_from_dict_creation(self) -> None:
-        """Test creating ApplicationConfig from dictionary."""
-        data = {
+        expected = {
             "auth": {
-                "timeout_seconds": 90,
-                "auth_method": "kerberos"
+                "timeout_seconds": 60,
+                "max_retry_attempts": 3,
+                "check_interval_seconds": 300,
+                "session_duration_hours": 8,
+                "auto_refresh": True,
+                "require_auth": True,
+                "auth_method": "midway",
+                "cache_credentials": False
             },
             "report": {
-                "format": "json",
-                "max_results_display": 200
+                "format": "table",
+                "output_path": None,
+                "include_charts": True,
+                "color_output": True,
+                "template_name": None,
+                "sanitize_output": True,
+                "max_results_display": 100,
+                "show_progress": True,
+                "verbose": False,
+                "theme": "auto"
             },
             "mcp": {
-                "server_command": ["python", "server.py"],
-                "connection_timeout": 45
+                "server_command": ["node", "mcp-server.js"],
+                "connection_timeout": 30,
+                "request_timeout": 60,
+                "max_retries": 3,
+                "retry_delay": 1.0,
+                "circuit_breaker_threshold": 5,
+                "circuit_breaker_timeout": 60,
+                "enable_logging": False
             },
             "logging": {
-                "level": "DEBUG",
-                "file_path": "/tmp/app.log"
+                "level": "INFO",
+                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                "file_path": None,
+                "max_file_size": 10 * 1024 * 1024,
+                "backup_count": 5,
+                "sanitize_logs": True,
+                "include_timestamps": True,
+                "include_caller_info": False
             },
+            "data_dir": None,
+            "config_dir": None,
+            "cache_dir": None,
+            "temp_dir": None,
             "debug_mode": True,
-            "max_concurrent_requests": 20
-        }
-        
-        config = ApplicationConfig.from_dict(data)
-        
-        # Check auth config
-        assert config.auth.timeout_seconds == 90
-        assert config.auth.auth_method == "kerberos"
-        
-        # Check report config
-        assert config.report.format == OutputFormat.JSON
-        assert config.report.max_results_display == 200
-        
-        # Check mcp config
-        assert config.mcp.server_command == ["python", "server.py"]
-        assert config.mcp.connection_timeout == 45
-        
-        # Check logging config
-        assert config.logging.level == LogLevel.DEBUG
-        assert config.logging.file_path == "/tmp/app.log"
-        
-        # Check other fields
-        assert config.debug_mode is True
-        assert config.max_concurrent_requests == 20
-    
-    def test_from_dict_with_partial_data(self) -> None:
-        """Test creating ApplicationConfig from dictionary with partial data."""
-        data = {
-            "auth": {
-                "timeout_seconds": 120
-            },
-            "debug_mode": True
+            "max_concurrent_requests": 15
         }
         
-        config = ApplicationConfig.from_dict(data)
-        
-        # Check that provided values are set
-        assert config.auth.timeout_seconds == 120
-        assert config.debug_mode is True
-        
-        # Check that other auth values use defaults
-        assert config.auth.max_retry_attempts == 3  # Default
-        assert config.auth.auth_method == "midway"  # Default
-        
-        # Check that other configs use defaults
-        assert config.report.format == OutputFormat.TABLE  # Default
-        assert config.max_concurrent_requests == 10  # Default
-    
-    def test_from_dict_empty_data(self) -> None:
-        """Test creating ApplicationConfig from empty dictionary."""
-        config = ApplicationConfig.from_dict({})
-        
-        # Should create config with all defaults
-        assert config.auth.timeout_seconds == 60  # Default
-        assert config.report.format == OutputFormat.TABLE  # Default
-        assert config.mcp.connection_timeout == 30  # Default
-        assert config.logging.level == LogLevel.INFO  # Default
-        assert config.debug_mode is False  # Default
-        assert config.max_concurrent_requests == 10  # Default
+        assert config.to_dict() == expected
+    
+    @pytest.mark.parametrize("data,expected", [
+        (_FULL_FROM_DICT_DATA, {
+            "auth.timeout_seconds": 90,
+            "auth.auth_method": "kerberos",
+            "report.format": OutputFormat.JSON,
+            "report.max_results_display": 200,
+            "mcp.server_command": ["python", "server.py"],
+            "mcp.connection_timeout": 45,
+            "logging.level": LogLevel.DEBUG,
+            "logging.file_path": "/tmp/app.log",
+            "debug_mode": True,
+            "max_concurrent_requests": 20,
+        }),
+        ({"auth": {"timeout_seconds": 120}, "debug_mode": True}, {
+            "auth.timeout_seconds": 120,
+            "debug_mode": True,
+            "auth.max_retry_attempts": 3,  # Default
+            "auth.auth_method": "midway",  # Default
+            "report.format": OutputFormat.TABLE,  # Default
+            "max_concurrent_requests": 10,  # Default
+        }),
+        ({}, {
+            "auth.timeout_seconds": 60,
+            "report.format": OutputFormat.TABLE,
+            "mcp.connection_timeout": 30,
+            "logging.level": LogLevel.INFO,
+            "debug_mode": False,
+            "max_concurrent_requests": 10,
+        }),
+    ], ids=["full", "partial", "empty"])
+    def test_from_dict(self, data: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        """Test creating ApplicationConfig from full, partial and empty dictionaries."""
+        # from_dict rewrites nested values in place, so keep the table pristine
+        config = ApplicationConfig.from_dict(copy.deepcopy(data))
+        
+        actual = {path: _getpath(config, path) for path in expected}
+        assert actual == expected
     
     def test_default_subconfig_independence(self) -> None:
         """Test that default sub-configurations are independent instances."""
@@ -721,23 +731,44 @@ class TestApplicationConfig:
         assert config2.auth.timeout_seconds == 60  # Default
         assert config2.report.max_results_display == 100  # Default
     
-    def test_edge_case_very_large_max_concurrent_requests(self) -> None:
+    def test_edge_case_very_large_max_concurrent_requests(
+        self, default_app_config: ApplicationConfig
+    ) -> None:
         """Test handling of very large max_concurrent_requests."""
-        config = ApplicationConfig(max_concurrent_requests=100)  # At the limit
+        # Shallow copies share the untouched sub-configs with the fixture
+        at_limit = dataclasses.replace(default_app_config, max_concurrent_requests=100)
         
         # Should validate successfully
-        config.validate()
+        at_limit.validate()
         
         # But 101 should fail
-        config.max_concurrent_requests = 101
+        over_limit = dataclasses.replace(default_app_config, max_concurrent_requests=101)
         with pytest.raises(ValueError):
-            config.validate()
+            over_limit.validate()
     
-    def test_edge_case_zero_values_in_subconfigs(self) -> None:
+    def test_edge_case_zero_values_in_subconfigs(self, app_config: ApplicationConfig) -> None:
         """Test handling of zero values in sub-configurations."""
         # This should fail validation due to zero timeout
-        config = ApplicationConfig()
+        config = app_config
         config.auth.timeout_seconds = 0
         
-        with pytest.raises(ValueError, match="timeout_seconds must be positive"):
-            config.validate()
\ No newline at end of file
+        with pytest.raises(ValueError, match=_must_be_positive("timeout_seconds")):
+            config.validate()
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestFromDictScaling:
+    """Benchmark ApplicationConfig.from_dict across growing batch sizes."""
+    
+    @pytest.mark.parametrize("n", [10, 100, 1000])
+    def test_from_dict_batch(self, n: int, benchmark: Any) -> None:
+        """Test from_dict throughput for a batch of n auth-only dictionaries."""
+        # Setup: deterministic inputs built once, outside the timed region.
+        # Auth-only data is never rewritten in place, so reruns see the same input.
+        dicts = [{"auth": {"timeout_seconds": 60 + i % 30}} for i in range(n)]
+        
+        configs = benchmark(lambda: [ApplicationConfig.from_dict(d) for d in dicts])
+        
+        assert len(configs) == n
+        assert configs[-1].auth.timeout_seconds == 60 + (n - 1) % 30
@@ -6,8 +6,11 @@ covering exception instantiation, inheritance, error message formatting,
 and context information handling.
 """
 
+import copy
+from types import MappingProxyType
+
 import pytest
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Tuple, Type
 
 from ticket_analyzer.models.exceptions import (
     TicketAnalysisError, AuthenticationError, ConfigurationError,
@@ -19,46 +22,251 @@ from ticket_analyzer.models.exceptions import (
 )
 
 
+# Thin exception classes only; safe for the quick local loop. Under xdist the
+# whole module stays on one worker (needs --dist=loadgroup, set in addopts).
+pytestmark = [pytest.mark.fast, pytest.mark.xdist_group("exceptions")]
+
+
+# Read-only payloads shared by the edge-case tests
+_LONG_MSG = "x" * 10000
+_COMPLEX_DETAILS = MappingProxyType({
+    "nested": {
+        "level1": {
+            "level2": ["item1", "item2"]
+        }
+    },
+    "list": [1, 2, {"key": "value"}],
+    "none_value": None,
+    "boolean": True
+})
+_COMPLEX_DETAILS_REPR = repr(dict(_COMPLEX_DETAILS))
+
+# Expected ancestors of each derived exception, nearest first
+_EXC_ANCESTORS = {
+    AuthenticationError: (TicketAnalysisError,),
+    ConfigurationError: (TicketAnalysisError,),
+    DataRetrievalError: (TicketAnalysisError,),
+    AnalysisError: (TicketAnalysisError,),
+    ValidationError: (TicketAnalysisError,),
+    MCPError: (DataRetrievalError, TicketAnalysisError),
+    MCPConnectionError: (MCPError, DataRetrievalError, TicketAnalysisError),
+    MCPTimeoutError: (MCPError, DataRetrievalError, TicketAnalysisError),
+    MCPAuthenticationError: (MCPError, DataRetrievalError, TicketAnalysisError),
+    MCPResponseError: (MCPError, DataRetrievalError, TicketAnalysisError),
+    CircuitBreakerOpenError: (DataRetrievalError, TicketAnalysisError),
+    DataProcessingError: (AnalysisError, TicketAnalysisError),
+    ReportGenerationError: (TicketAnalysisError,),
+    SecurityError: (TicketAnalysisError,),
+    CLIError: (TicketAnalysisError,),
+    FileOperationError: (TicketAnalysisError,),
+}
+
+# Originals for wrap_exception; only read via str() and type()
+_ORIGINALS = {
+    "ve": ValueError("Original error"),
+    "ke": KeyError("Missing key"),
+    "re": RuntimeError("Runtime issue"),
+}
+
+# Attributes every TicketAnalysisError sets in __init__
+_REQUIRED_ATTRS = ("message", "details", "error_code")
+
+# Built once at import; only inspected, never mutated
+_SAMPLE_EXCEPTIONS = [
+    AuthenticationError("Auth error"),
+    ConfigurationError("Config error"),
+    DataRetrievalError("Data error"),
+    AnalysisError("Analysis error"),
+    ValidationError("Validation error")
+]
+
+# (cls, kwargs, expected error_code, expected details)
+EXC_CASES = [
+    pytest.param(
+        AuthenticationError, {"auth_method": "midway"}, "AUTH_ERROR",
+        {"auth_method": "midway"},
+        id="auth-method"
+    ),
+    pytest.param(
+        AuthenticationError,
+        {"details": {"timeout": 60}, "auth_method": "kerberos"},
+        "AUTH_ERROR",
+        {"timeout": 60, "auth_method": "kerberos"},
+        id="auth-details"
+    ),
+    pytest.param(
+        AuthenticationError, {}, "AUTH_ERROR",
+        {},
+        id="auth-default"
+    ),
+    pytest.param(
+        ConfigurationError, {"config_file": "/path/config.json"}, "CONFIG_ERROR",
+        {"config_file": "/path/config.json"},
+        id="config-file"
+    ),
+    pytest.param(
+        ConfigurationError, {"config_key": "database.host"}, "CONFIG_ERROR",
+        {"config_key": "database.host"},
+        id="config-key"
+    ),
+    pytest.param(
+        ConfigurationError,
+        {"config_file": "/etc/app.conf", "config_key": "auth.timeout"},
+        "CONFIG_ERROR",
+        {"config_file": "/etc/app.conf", "config_key": "auth.timeout"},
+        id="config-file-and-key"
+    ),
+    pytest.param(
+        DataRetrievalError,
+        {"service": "MCP", "operation": "search_tickets"},
+        "DATA_ERROR",
+        {"service": "MCP", "operation": "search_tickets"},
+        id="data"
+    ),
+    pytest.param(
+        AnalysisError,
+        {"analysis_type": "resolution_time", "data_size": 1000},
+        "ANALYSIS_ERROR",
+        {"analysis_type": "resolution_time", "data_size": 1000},
+        id="analysis"
+    ),
+    pytest.param(
+        ValidationError,
+        {"field_name": "email", "validation_rule": "email_format"},
+        "VALIDATION_ERROR",
+        {"field_name": "email", "validation_rule": "email_format"},
+        id="validation"
+    ),
+    # mcp_method becomes the operation; service is always MCP
+    pytest.param(
+        MCPError, {"mcp_method": "search"}, "MCP_ERROR",
+        {"service": "MCP", "operation": "search"},
+        id="mcp-method"
+    ),
+    pytest.param(
+        MCPError, {}, "MCP_ERROR",
+        {"service": "MCP"},
+        id="mcp-default"
+    ),
+    pytest.param(
+        MCPConnectionError,
+        {"server_command": "node server.js"},
+        "MCP_CONNECTION_ERROR",
+        {"service": "MCP", "operation": "connect", "server_command": "node server.js"},
+        id="mcp-connection-command"
+    ),
+    pytest.param(
+        MCPConnectionError, {}, "MCP_CONNECTION_ERROR",
+        {"service": "MCP", "operation": "connect"},
+        id="mcp-connection-default"
+    ),
+    pytest.param(
+        MCPTimeoutError, {"timeout_duration": 30.5}, "MCP_TIMEOUT_ERROR",
+        {"service": "MCP", "operation": "timeout", "timeout_duration": 30.5},
+        id="mcp-timeout-duration"
+    ),
+    pytest.param(
+        MCPTimeoutError, {}, "MCP_TIMEOUT_ERROR",
+        {"service": "MCP", "operation": "timeout"},
+        id="mcp-timeout-default"
+    ),
+    pytest.param(
+        MCPAuthenticationError, {}, "MCP_AUTH_ERROR",
+        {"service": "MCP", "operation": "authenticate"},
+        id="mcp-auth-default"
+    ),
+    pytest.param(
+        MCPResponseError,
+        {"response_data": {"error": "invalid_format", "code": 400}},
+        "MCP_RESPONSE_ERROR",
+        {
+            "service": "MCP",
+            "operation": "parse_response",
+            "response_data": {"error": "invalid_format", "code": 400}
+        },
+        id="mcp-response-data"
+    ),
+    pytest.param(
+        MCPResponseError, {}, "MCP_RESPONSE_ERROR",
+        {"service": "MCP", "operation": "parse_response"},
+        id="mcp-response-default"
+    ),
+    pytest.param(
+        CircuitBreakerOpenError, {"failure_count": 5}, "CIRCUIT_BREAKER_OPEN",
+        {"service": "circuit_breaker", "operation": "open", "failure_count": 5},
+        id="circuit-breaker"
+    ),
+    pytest.param(
+        DataProcessingError,
+        {"processing_stage": "validation"},
+        "DATA_PROCESSING_ERROR",
+        {"analysis_type": "data_processing", "processing_stage": "validation"},
+        id="data-processing"
+    ),
+    pytest.param(
+        ReportGenerationError,
+        {"report_format": "html", "template_name": "custom.html"},
+        "REPORT_ERROR",
+        {"report_format": "html", "template_name": "custom.html"},
+        id="report"
+    ),
+    pytest.param(
+        SecurityError, {"security_rule": "admin_only"}, "SECURITY_ERROR",
+        {"security_rule": "admin_only"},
+        id="security"
+    ),
+    pytest.param(
+        CLIError, {"command": "analyze", "exit_code": 2}, "CLI_ERROR",
+        {"command": "analyze", "exit_code": 2},
+        id="cli"
+    ),
+    # exit_code defaults to 1
+    pytest.param(
+        CLIError, {}, "CLI_ERROR",
+        {"exit_code": 1},
+        id="cli-default"
+    ),
+    pytest.param(
+        FileOperationError,
+        {"file_path": "/tmp/test.txt", "operation": "read"},
+        "FILE_ERROR",
+        {"file_path": "/tmp/test.txt", "operation": "read"},
+        id="file"
+    ),
+]
+
+
 class TestTicketAnalysisError:
     """Test cases for base TicketAnalysisError class."""
     
-    def test_basic_initialization(self) -> None:
+    def test_basic_initialization(self, base_error: TicketAnalysisError) -> None:
         """Test basic exception initialization with message only."""
-        error = TicketAnalysisError("Test error message")
-        
-        assert str(error) == "Test error message"
-        assert error.message == "Test error message"
-        assert error.details == {}
-        assert error.error_code is None
+        assert str(base_error) == "Test"
+        assert base_error.message == "Test"
+        assert base_error.details == {}
+        assert base_error.error_code is None
     
-    def test_initialization_with_details(self) -> None:
-        """Test exception initialization with details."""
+    def test_initialization_variants(self) -> None:
+        """Test initialization with details, error code, and both together."""
         details = {"operation": "test", "value": 42}
-        error = TicketAnalysisError("Test error", details=details)
+        with_details = TicketAnalysisError("Test error", details=details)
+        assert with_details.message == "Test error"
+        assert with_details.details == details
+        assert with_details.error_code is None
         
-        assert error.message == "Test error"
-        assert error.details == details
-        assert error.error_code is None
-    
-    def test_initialization_with_error_code(self) -> None:
-        """Test exception initialization with error code."""
-        error = TicketAnalysisError("Test error", error_code="TEST_ERROR")
+        with_code = TicketAnalysisError("Test error", error_code="TEST_ERROR")
+        assert with_code.message == "Test error"
+        assert with_code.error_code == "TEST_ERROR"
         
-        assert error.message == "Test error"
-        assert error.error_code == "TEST_ERROR"
-    
-    def test_initialization_with_all_parameters(self) -> None:
-        """Test exception initialization with all parameters."""
-        details = {"context": "test"}
-        error = TicketAnalysisError(
+        complete_details = {"context": "test"}
+        complete = TicketAnalysisError(
             "Complete error",
-            details=details,
+            details=complete_details,
             error_code="COMPLETE_ERROR"
         )
-        
-        assert error.message == "Complete error"
-        assert error.details == details
-        assert error.error_code == "COMPLETE_ERROR"
+        assert complete.message == "Complete error"
+        assert complete.details == complete_details
+        assert complete.error_code == "COMPLETE_ERROR"
     
     def test_str_representation_with_details(self) -> None:
         """Test string representation includes details when present."""
@@ -66,10 +274,8 @@ class TestTicketAnalysisError:
         error = TicketAnalysisError("Error with details", details=details)
         
         str_repr = str(error)
-        assert "Error with details" in str_repr
-        assert "Details:" in str_repr
-        assert "operation" in str_repr
-        assert "count" in str_repr
+        expected = ("Error with details", "Details:", "operation", "count")
+        assert all(token in str_repr for token in expected), str_repr
     
     def test_str_representation_without_details(self) -> None:
         """Test string representation without details."""
@@ -85,10 +291,11 @@ class TestTicketAnalysisError:
         error = TicketAnalysisError("Test", details=details, error_code="TEST")
         
         repr_str = repr(error)
-        assert "TicketAnalysisError" in repr_str
-        assert "message='Test'" in repr_str
-        assert "details={'key': 'value'}" in repr_str
-        assert "error_code='TEST'" in repr_str
+        expected = (
+            "TicketAnalysisError", "message='Test'",
+            "details={'key': 'value'}", "error_code='TEST'"
+        )
+        assert all(token in repr_str for token in expected), repr_str
     
     def test_add_detail(self) -> None:
         """Test adding detail information to exception."""
@@ -109,25 +316,20 @@ class TestTicketAnalysisError:
         assert error.get_detail("operation") == "test"
         assert error.get_detail("count") == 42
     
-    def test_get_detail_nonexistent_with_default(self) -> None:
+    def test_get_detail_nonexistent_with_default(self, base_error: TicketAnalysisError) -> None:
         """Test getting nonexistent detail with default value."""
-        error = TicketAnalysisError("Test")
-        
-        assert error.get_detail("nonexistent", "default") == "default"
-        assert error.get_detail("missing", 0) == 0
+        assert base_error.get_detail("nonexistent", "default") == "default"
+        assert base_error.get_detail("missing", 0) == 0
     
-    def test_get_detail_nonexistent_without_default(self) -> None:
+    def test_get_detail_nonexistent_without_default(
+        self, base_error: TicketAnalysisError
+    ) -> None:
         """Test getting nonexistent detail without default value."""
-        error = TicketAnalysisError("Test")
-        
-        assert error.get_detail("nonexistent") is None
+        assert base_error.get_detail("nonexistent") is None
     
-    def test_inheritance_from_exception(self) -> None:
+    def test_inheritance_from_exception(self, base_error: TicketAnalysisError) -> None:
         """Test that TicketAnalysisError inherits from Exception."""
-        error = TicketAnalysisError("Test")
-        
-        assert isinstance(error, Exception)
-        assert isinstance(error, TicketAnalysisError)
+        assert isinstance(base_error, Exception)
     
     def test_exception_raising_and_catching(self) -> None:
         """Test raising and catching the exception."""
@@ -138,444 +340,74 @@ class TestTicketAnalysisError:
         assert exc_info.value.message == "Test exception"
 
 
-class TestAuthenticationError:
-    """Test cases for AuthenticationError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that AuthenticationError inherits from TicketAnalysisError."""
-        error = AuthenticationError("Auth failed")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, AuthenticationError)
-    
-    def test_initialization_with_auth_method(self) -> None:
-        """Test initialization with auth_method parameter."""
-        error = AuthenticationError("Auth failed", auth_method="midway")
-        
-        assert error.message == "Auth failed"
-        assert error.error_code == "AUTH_ERROR"
-        assert error.get_detail("auth_method") == "midway"
-    
-    def test_initialization_with_details_and_auth_method(self) -> None:
-        """Test initialization with both details and auth_method."""
-        details = {"timeout": 60}
-        error = AuthenticationError(
-            "Timeout error",
-            details=details,
-            auth_method="kerberos"
-        )
-        
-        assert error.message == "Timeout error"
-        assert error.error_code == "AUTH_ERROR"
-        assert error.get_detail("timeout") == 60
-        assert error.get_detail("auth_method") == "kerberos"
-    
-    def test_default_error_code(self) -> None:
-        """Test that default error code is set."""
-        error = AuthenticationError("Test")
-        assert error.error_code == "AUTH_ERROR"
-
-
-class TestConfigurationError:
-    """Test cases for ConfigurationError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that ConfigurationError inherits from TicketAnalysisError."""
-        error = ConfigurationError("Config error")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, ConfigurationError)
-    
-    def test_initialization_with_config_file(self) -> None:
-        """Test initialization with config_file parameter."""
-        error = ConfigurationError("Invalid config", config_file="/path/config.json")
-        
-        assert error.message == "Invalid config"
-        assert error.error_code == "CONFIG_ERROR"
-        assert error.get_detail("config_file") == "/path/config.json"
-    
-    def test_initialization_with_config_key(self) -> None:
-        """Test initialization with config_key parameter."""
-        error = ConfigurationError("Invalid key", config_key="database.host")
-        
-        assert error.message == "Invalid key"
-        assert error.get_detail("config_key") == "database.host"
-    
-    def test_initialization_with_all_config_params(self) -> None:
-        """Test initialization with all configuration parameters."""
-        error = ConfigurationError(
-            "Config error",
-            config_file="/etc/app.conf",
-            config_key="auth.timeout"
-        )
-        
-        assert error.get_detail("config_file") == "/etc/app.conf"
-        assert error.get_detail("config_key") == "auth.timeout"
-
-
-class TestDataRetrievalError:
-    """Test cases for DataRetrievalError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that DataRetrievalError inherits from TicketAnalysisError."""
-        error = DataRetrievalError("Data error")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, DataRetrievalError)
-    
-    def test_initialization_with_service_and_operation(self) -> None:
-        """Test initialization with service and operation parameters."""
-        error = DataRetrievalError(
-            "API failed",
-            service="MCP",
-            operation="search_tickets"
-        )
-        
-        assert error.message == "API failed"
-        assert error.error_code == "DATA_ERROR"
-        assert error.get_detail("service") == "MCP"
-        assert error.get_detail("operation") == "search_tickets"
-
-
-class TestAnalysisError:
-    """Test cases for AnalysisError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that AnalysisError inherits from TicketAnalysisError."""
-        error = AnalysisError("Analysis failed")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, AnalysisError)
-    
-    def test_initialization_with_analysis_params(self) -> None:
-        """Test initialization with analysis-specific parameters."""
-        error = AnalysisError(
-            "Calculation failed",
-            analysis_type="resolution_time",
-            data_size=1000
-        )
-        
-        assert error.message == "Calculation failed"
-        assert error.error_code == "ANALYSIS_ERROR"
-        assert error.get_detail("analysis_type") == "resolution_time"
-        assert error.get_detail("data_size") == 1000
-
-
-class TestValidationError:
-    """Test cases for ValidationError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that ValidationError inherits from TicketAnalysisError."""
-        error = ValidationError("Validation failed")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, ValidationError)
-    
-    def test_initialization_with_validation_params(self) -> None:
-        """Test initialization with validation-specific parameters."""
-        error = ValidationError(
-            "Invalid field",
-            field_name="email",
-            validation_rule="email_format"
-        )
-        
-        assert error.message == "Invalid field"
-        assert error.error_code == "VALIDATION_ERROR"
-        assert error.get_detail("field_name") == "email"
-        assert error.get_detail("validation_rule") == "email_format"
-
-
-class TestMCPError:
-    """Test cases for MCPError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that MCPError inherits from DataRetrievalError."""
-        error = MCPError("MCP failed")
-        
-        assert isinstance(error, DataRetrievalError)
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, MCPError)
-    
-    def test_initialization_with_mcp_method(self) -> None:
-        """Test initialization with mcp_method parameter."""
-        error = MCPError("Request failed", mcp_method="search")
-        
-        assert error.message == "Request failed"
-        assert error.error_code == "MCP_ERROR"
-        assert error.get_detail("service") == "MCP"
-        assert error.get_detail("operation") == "search"  # mcp_method becomes operation
-    
-    def test_default_service_setting(self) -> None:
-        """Test that service is automatically set to MCP."""
-        error = MCPError("Test error")
-        assert error.get_detail("service") == "MCP"
-
-
-class TestMCPConnectionError:
-    """Test cases for MCPConnectionError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that MCPConnectionError inherits from MCPError."""
-        error = MCPConnectionError("Connection failed")
-        
-        assert isinstance(error, MCPError)
-        assert isinstance(error, DataRetrievalError)
-        assert isinstance(error, MCPConnectionError)
-    
-    def test_initialization_with_server_command(self) -> None:
-        """Test initialization with server_command parameter."""
-        error = MCPConnectionError(
-            "Server start failed",
-            server_command="node server.js"
-        )
-        
-        assert error.message == "Server start failed"
-        assert error.error_code == "MCP_CONNECTION_ERROR"
-        assert error.get_detail("server_command") == "node server.js"
-    
-    def test_default_operation_setting(self) -> None:
-        """Test that operation is set to 'connect'."""
-        error = MCPConnectionError("Test")
-        assert error.get_detail("operation") == "connect"
+@pytest.mark.parametrize(
+    "cls,bases", list(_EXC_ANCESTORS.items()), ids=[cls.__name__ for cls in _EXC_ANCESTORS]
+)
+def test_inheritance(cls: Type[TicketAnalysisError], bases: Tuple[type, ...]) -> None:
+    """Test that each derived exception inherits from its expected ancestors."""
+    # A tuple argument to issubclass means "any of", so check each ancestor
+    for base in bases:
+        assert issubclass(cls, base)
 
 
-class TestMCPTimeoutError:
-    """Test cases for MCPTimeoutError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that MCPTimeoutError inherits from MCPError."""
-        error = MCPTimeoutError("Timeout")
-        
-        assert isinstance(error, MCPError)
-        assert isinstance(error, MCPTimeoutError)
-    
-    def test_initialization_with_timeout_duration(self) -> None:
-        """Test initialization with timeout_duration parameter."""
-        error = MCPTimeoutError("Request timeout", timeout_duration=30.5)
-        
-        assert error.message == "Request timeout"
-        assert error.error_code == "MCP_TIMEOUT_ERROR"
-        assert error.get_detail("timeout_duration") == 30.5
+@pytest.mark.parametrize("cls,kwargs,code,details", EXC_CASES)
+def test_error_code(
+    cls: Type[TicketAnalysisError], kwargs: Dict[str, Any], code: str,
+    details: Dict[str, Any]
+) -> None:
+    """Test that each derived exception sets its default error code."""
+    error = cls("Test error", **copy.deepcopy(kwargs))
     
-    def test_default_operation_setting(self) -> None:
-        """Test that operation is set to 'timeout'."""
-        error = MCPTimeoutError("Test")
-        assert error.get_detail("operation") == "timeout"
+    assert error.error_code == code
 
 
-class TestMCPAuthenticationError:
-    """Test cases for MCPAuthenticationError class."""
+@pytest.mark.parametrize("cls,kwargs,code,details", EXC_CASES)
+def test_details(
+    cls: Type[TicketAnalysisError], kwargs: Dict[str, Any], code: str,
+    details: Dict[str, Any]
+) -> None:
+    """Test that constructor parameters are recorded as exception details."""
+    # Constructors add to a caller-supplied details dict in place
+    error = cls("Test error", **copy.deepcopy(kwargs))
     
-    def test_inheritance(self) -> None:
-        """Test that MCPAuthenticationError inherits from MCPError."""
-        error = MCPAuthenticationError("Auth failed")
-        
-        assert isinstance(error, MCPError)
-        assert isinstance(error, MCPAuthenticationError)
-    
-    def test_default_values(self) -> None:
-        """Test default error code and operation values."""
-        error = MCPAuthenticationError("Auth failed")
-        
-        assert error.error_code == "MCP_AUTH_ERROR"
-        assert error.get_detail("operation") == "authenticate"
-
-
-class TestMCPResponseError:
-    """Test cases for MCPResponseError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that MCPResponseError inherits from MCPError."""
-        error = MCPResponseError("Invalid response")
-        
-        assert isinstance(error, MCPError)
-        assert isinstance(error, MCPResponseError)
-    
-    def test_initialization_with_response_data(self) -> None:
-        """Test initialization with response_data parameter."""
-        response_data = {"error": "invalid_format", "code": 400}
-        error = MCPResponseError("Bad response", response_data=response_data)
-        
-        assert error.message == "Bad response"
-        assert error.error_code == "MCP_RESPONSE_ERROR"
-        assert error.get_detail("response_data") == response_data
-    
-    def test_default_operation_setting(self) -> None:
-        """Test that operation is set to 'parse_response'."""
-        error = MCPResponseError("Test")
-        assert error.get_detail("operation") == "parse_response"
+    assert error.message == "Test error"
+    assert error.details == details
 
 
 class TestCircuitBreakerOpenError:
     """Test cases for CircuitBreakerOpenError class."""
     
-    def test_inheritance(self) -> None:
-        """Test that CircuitBreakerOpenError inherits from DataRetrievalError."""
-        error = CircuitBreakerOpenError()
-        
-        assert isinstance(error, DataRetrievalError)
-        assert isinstance(error, CircuitBreakerOpenError)
-    
     def test_default_message(self) -> None:
         """Test default error message."""
         error = CircuitBreakerOpenError()
         
         assert error.message == "Circuit breaker is open"
-        assert error.error_code == "CIRCUIT_BREAKER_OPEN"
+        assert error.get_detail("operation") == "open"
     
     def test_custom_message(self) -> None:
         """Test custom error message."""
         error = CircuitBreakerOpenError("Custom message")
         
         assert error.message == "Custom message"
-    
-    def test_initialization_with_failure_count(self) -> None:
-        """Test initialization with failure_count parameter."""
-        error = CircuitBreakerOpenError(failure_count=5)
-        
-        assert error.get_detail("failure_count") == 5
-        assert error.get_detail("service") == "circuit_breaker"
-        assert error.get_detail("operation") == "open"
-
-
-class TestDataProcessingError:
-    """Test cases for DataProcessingError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that DataProcessingError inherits from AnalysisError."""
-        error = DataProcessingError("Processing failed")
-        
-        assert isinstance(error, AnalysisError)
-        assert isinstance(error, DataProcessingError)
-    
-    def test_initialization_with_processing_stage(self) -> None:
-        """Test initialization with processing_stage parameter."""
-        error = DataProcessingError("Stage failed", processing_stage="validation")
-        
-        assert error.message == "Stage failed"
-        assert error.error_code == "DATA_PROCESSING_ERROR"
-        assert error.get_detail("processing_stage") == "validation"
-        assert error.get_detail("analysis_type") == "data_processing"
-
-
-class TestReportGenerationError:
-    """Test cases for ReportGenerationError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that ReportGenerationError inherits from TicketAnalysisError."""
-        error = ReportGenerationError("Report failed")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, ReportGenerationError)
-    
-    def test_initialization_with_report_params(self) -> None:
-        """Test initialization with report-specific parameters."""
-        error = ReportGenerationError(
-            "Template error",
-            report_format="html",
-            template_name="custom.html"
-        )
-        
-        assert error.message == "Template error"
-        assert error.error_code == "REPORT_ERROR"
-        assert error.get_detail("report_format") == "html"
-        assert error.get_detail("template_name") == "custom.html"
-
-
-class TestSecurityError:
-    """Test cases for SecurityError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that SecurityError inherits from TicketAnalysisError."""
-        error = SecurityError("Security violation")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, SecurityError)
-    
-    def test_initialization_with_security_rule(self) -> None:
-        """Test initialization with security_rule parameter."""
-        error = SecurityError("Access denied", security_rule="admin_only")
-        
-        assert error.message == "Access denied"
-        assert error.error_code == "SECURITY_ERROR"
-        assert error.get_detail("security_rule") == "admin_only"
-
-
-class TestCLIError:
-    """Test cases for CLIError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that CLIError inherits from TicketAnalysisError."""
-        error = CLIError("CLI failed")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, CLIError)
-    
-    def test_initialization_with_cli_params(self) -> None:
-        """Test initialization with CLI-specific parameters."""
-        error = CLIError("Command failed", command="analyze", exit_code=2)
-        
-        assert error.message == "Command failed"
-        assert error.error_code == "CLI_ERROR"
-        assert error.get_detail("command") == "analyze"
-        assert error.get_detail("exit_code") == 2
-    
-    def test_default_exit_code(self) -> None:
-        """Test default exit code is 1."""
-        error = CLIError("Test")
-        assert error.get_detail("exit_code") == 1
-
-
-class TestFileOperationError:
-    """Test cases for FileOperationError class."""
-    
-    def test_inheritance(self) -> None:
-        """Test that FileOperationError inherits from TicketAnalysisError."""
-        error = FileOperationError("File error")
-        
-        assert isinstance(error, TicketAnalysisError)
-        assert isinstance(error, FileOperationError)
-    
-    def test_initialization_with_file_params(self) -> None:
-        """Test initialization with file-specific parameters."""
-        error = FileOperationError(
-            "Read failed",
-            file_path="/tmp/test.txt",
-            operation="read"
-        )
-        
-        assert error.message == "Read failed"
-        assert error.error_code == "FILE_ERROR"
-        assert error.get_detail("file_path") == "/tmp/test.txt"
-        assert error.get_detail("operation") == "read"
 
 
 class TestUtilityFunctions:
     """Test cases for utility functions."""
     
-    def test_create_error_context(self) -> None:
-        """Test create_error_context function."""
-        context = create_error_context("test_operation", user="testuser", count=5)
-        
-        expected = {
-            "operation": "test_operation",
-            "user": "testuser",
-            "count": 5
-        }
-        
-        assert context == expected
-    
-    def test_create_error_context_operation_only(self) -> None:
-        """Test create_error_context with operation only."""
-        context = create_error_context("simple_op")
-        
-        assert context == {"operation": "simple_op"}
+    @pytest.mark.parametrize("operation,kwargs,expected", [
+        ("test_operation", {"user": "testuser", "count": 5},
+         {"operation": "test_operation", "user": "testuser", "count": 5}),
+        ("simple_op", {}, {"operation": "simple_op"}),
+    ], ids=["with_context", "operation_only"])
+    def test_create_error_context(
+        self, operation: str, kwargs: Dict[str, Any], expected: Dict[str, Any]
+    ) -> None:
+        """Test create_error_context with and without extra context."""
+        assert create_error_context(operation, **kwargs) == expected
     
     def test_wrap_exception_default_class(self) -> None:
         """Test wrap_exception with default exception class."""
-        original = ValueError("Original error")
-        
-        wrapped = wrap_exception(original, "Wrapped error", user="test")
+        wrapped = wrap_exception(_ORIGINALS["ve"], "Wrapped error", user="test")
         
         assert isinstance(wrapped, TicketAnalysisError)
         assert wrapped.message == "Wrapped error"
@@ -586,10 +418,8 @@ class TestUtilityFunctions:
     
     def test_wrap_exception_custom_class(self) -> None:
         """Test wrap_exception with custom exception class."""
-        original = KeyError("Missing key")
-        
         wrapped = wrap_exception(
-            original,
+            _ORIGINALS["ke"],
             "Config error",
             error_class=ConfigurationError,
             config_file="test.json"
@@ -603,10 +433,8 @@ class TestUtilityFunctions:
     
     def test_wrap_exception_preserves_context(self) -> None:
         """Test that wrap_exception preserves all context information."""
-        original = RuntimeError("Runtime issue")
-        
         wrapped = wrap_exception(
-            original,
+            _ORIGINALS["re"],
             "Wrapped runtime error",
             operation="test",
             timestamp="2024-01-01",
@@ -618,6 +446,20 @@ class TestUtilityFunctions:
         assert wrapped.get_detail("severity") == "high"
         assert wrapped.get_detail("original_exception") == "Runtime issue"
         assert wrapped.get_detail("original_type") == "RuntimeError"
+    
+    @pytest.mark.parametrize("original,type_name", [
+        (_ORIGINALS["ve"], "ValueError"),
+        (_ORIGINALS["ke"], "KeyError"),
+        (_ORIGINALS["re"], "RuntimeError"),
+    ], ids=["ve", "ke", "re"])
+    def test_wrap_exception_preserves_original(
+        self, original: Exception, type_name: str
+    ) -> None:
+        """Test that wrap_exception records the original exception and its type."""
+        wrapped = wrap_exception(original, "Wrapped error")
+        
+        assert wrapped.get_detail("original_exception") == str(original)
+        assert wrapped.get_detail("original_type") == type_name
 
 
 class TestExceptionChaining:
@@ -626,50 +468,26 @@ class TestExceptionChaining:
     def test_exception_chain_catching(self) -> None:
         """Test catching exceptions in inheritance chain."""
         # MCPConnectionError should be catchable as MCPError, DataRetrievalError, and TicketAnalysisError
-        
-        with pytest.raises(TicketAnalysisError):
-            raise MCPConnectionError("Connection failed")
-        
-        with pytest.raises(DataRetrievalError):
-            raise MCPConnectionError("Connection failed")
-        
-        with pytest.raises(MCPError):
-            raise MCPConnectionError("Connection failed")
-        
-        with pytest.raises(MCPConnectionError):
-            raise MCPConnectionError("Connection failed")
+        err = MCPConnectionError("Connection failed")
+        for cls in (TicketAnalysisError, DataRetrievalError, MCPError, MCPConnectionError):
+            assert isinstance(err, cls)
     
     def test_specific_exception_catching(self) -> None:
         """Test catching specific exception types."""
-        try:
+        with pytest.raises(AuthenticationError) as exc_info:
             raise AuthenticationError("Auth failed", auth_method="midway")
-        except AuthenticationError as e:
-            assert e.message == "Auth failed"
-            assert e.get_detail("auth_method") == "midway"
-            assert e.error_code == "AUTH_ERROR"
-        except Exception:
-            pytest.fail("Should have caught AuthenticationError specifically")
+        
+        e = exc_info.value
+        assert e.message == "Auth failed"
+        assert e.get_detail("auth_method") == "midway"
+        assert e.error_code == "AUTH_ERROR"
     
-    def test_base_exception_catching(self) -> None:
+    @pytest.mark.parametrize("exc", _SAMPLE_EXCEPTIONS, ids=lambda exc: type(exc).__name__)
+    def test_base_exception_catching(self, exc: TicketAnalysisError) -> None:
         """Test catching various exceptions as base TicketAnalysisError."""
-        exceptions = [
-            AuthenticationError("Auth error"),
-            ConfigurationError("Config error"),
-            DataRetrievalError("Data error"),
-            AnalysisError("Analysis error"),
-            ValidationError("Validation error")
-        ]
-        
-        for exc in exceptions:
-            try:
-                raise exc
-            except TicketAnalysisError as e:
-                assert isinstance(e, TicketAnalysisError)
-                assert hasattr(e, 'message')
-                assert hasattr(e, 'details')
-                assert hasattr(e, 'error_code')
-            except Exception:
-                pytest.fail(f"Should have caught {type(exc).__name__} as TicketAnalysisError")
+        # An except clause matches exactly when isinstance does, so no raise is needed
+        assert isinstance(exc, TicketAnalysisError)
+        assert all(hasattr(exc, attr) for attr in _REQUIRED_ATTRS), exc
 
 
 class TestEdgeCases:
@@ -690,12 +508,12 @@ class TestEdgeCases:
     
     def test_very_long_message(self) -> None:
         """Test exception with very long message."""
-        long_message = "x" * 10000
-        error = TicketAnalysisError(long_message)
+        error = TicketAnalysisError(_LONG_MSG)
         
-        assert error.message == long_message
+        assert error.message == _LONG_MSG
         assert len(str(error)) == 10000
     
+    @pytest.mark.depends_on("ticket_analyzer.models.exceptions")
     def test_special_characters_in_message(self) -> None:
         """Test exception with special characters in message."""
         special_message = "Error: 'test' failed with \"quotes\" and \n newlines \t tabs"
@@ -704,6 +522,7 @@ class TestEdgeCases:
         assert error.message == special_message
         assert special_message in str(error)
     
+    @pytest.mark.depends_on("ticket_analyzer.models.exceptions")
     def test_unicode_characters_in_message(self) -> None:
         """Test exception with unicode characters in message."""
         unicode_message = "Error: αβγδε 中文 日本語 한국어 🚨"
@@ -714,24 +533,13 @@ class TestEdgeCases:
     
     def test_complex_details_structure(self) -> None:
         """Test exception with complex nested details structure."""
-        complex_details = {
-            "nested": {
-                "level1": {
-                    "level2": ["item1", "item2"]
-                }
-            },
-            "list": [1, 2, {"key": "value"}],
-            "none_value": None,
-            "boolean": True
-        }
-        
-        error = TicketAnalysisError("Complex error", details=complex_details)
+        # add_detail writes into the details dict, so hand over a copy
+        details = dict(_COMPLEX_DETAILS)
+        error = TicketAnalysisError("Complex error", details=details)
         
-        assert error.details == complex_details
-        assert error.get_detail("nested") == complex_details["nested"]
-        assert error.get_detail("list") == complex_details["list"]
-        assert error.get_detail("none_value") is None
-        assert error.get_detail("boolean") is True
+        # The dict is stored as given; one string compare covers the whole tree
+        assert error.details is details
+        assert repr(error.details) == _COMPLEX_DETAILS_REPR
     
     def test_modifying_details_after_creation(self) -> None:
         """Test modifying details after exception creation."""
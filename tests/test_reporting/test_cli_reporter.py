@@ -7,18 +7,77 @@ user feedback according to the testing standards.
 
 from __future__ import annotations
 import pytest
+import re
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, Any, List
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
-import sys
+from unittest.mock import patch
 
+from ticket_analyzer.reporting import cli_reporter
 from ticket_analyzer.reporting.cli_reporter import CLIReporter
 from ticket_analyzer.models.analysis import AnalysisResult
 from ticket_analyzer.models.config import ReportConfig
 from ticket_analyzer.models.exceptions import ReportGenerationError
 
 
+# Fixed timestamp and duration so generated reports are reproducible.
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_FIXED_DURATION = timedelta(hours=2, minutes=30)
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() always returns _FIXED_NOW."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return _FIXED_NOW
+
+
+# ANSI SGR sequences as emitted by colorama; compiled once for the module.
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _large_result(metric_count: int, trend_count: int,
+                  points_per_trend: int) -> AnalysisResult:
+    """Build an AnalysisResult with generated metrics and trend series."""
+    return AnalysisResult(
+        metrics={f"metric_{i}": i * 1.5 for i in range(metric_count)},
+        trends={
+            f"trend_{i}": {"data": list(range(points_per_trend))}
+            for i in range(trend_count)
+        },
+        summary={"total_tickets": 10000, "key_insights": ["Insight 1", "Insight 2"]},
+        generated_at=_FIXED_NOW,
+        ticket_count=10000
+    )
+
+
+def _generate_at_fixed_time(reporter: CLIReporter, analysis: AnalysisResult) -> str:
+    """Generate a default-config report with the footer clock pinned to _FIXED_NOW.
+    
+    The footer stamps ``datetime.now()`` to the second, so pinning it makes the
+    output a pure function of the analysis result.
+    """
+    with patch.object(cli_reporter, "datetime", _FixedDatetime):
+        return reporter.generate_report(analysis, ReportConfig())
+
+
+@pytest.fixture(scope="module")
+def reporter() -> CLIReporter:
+    """Read-only CLIReporter with default settings, shared per module."""
+    return CLIReporter()
+
+
+@pytest.fixture(scope="module")
+def cached_report(reporter: CLIReporter, sample_analysis_result: AnalysisResult) -> str:
+    """Report generated once by the default reporter for the sample result.
+    
+    Read-only tests should assert against this string instead of calling
+    ``generate_report`` again; see ``_generate_at_fixed_time``.
+    """
+    return _generate_at_fixed_time(reporter, sample_analysis_result)
+
+
 class TestCLIReporter:
     """Test cases for CLIReporter class."""
     
@@ -42,49 +101,39 @@ class TestCLIReporter:
         
         assert reporter._config == config
     
-    def test_generate_report_success(self, sample_analysis_result):
+    def test_generate_report_success(self, reporter, sample_analysis_result, capsys):
         """Test successful report generation."""
-        reporter = CLIReporter()
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            result = reporter.generate_report(sample_analysis_result)
+        result = reporter.generate_report(sample_analysis_result)
         
         assert isinstance(result, str)
         assert len(result) > 0
         
         # Check that output was written to stdout
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert len(output) > 0
     
-    def test_generate_report_with_empty_result(self):
+    def test_generate_report_with_empty_result(self, reporter):
         """Test report generation with empty analysis result."""
-        reporter = CLIReporter()
-        
         empty_result = AnalysisResult(
             metrics={},
             trends={},
             summary={},
             ticket_count=0,
-            analysis_date=datetime.now()
+            analysis_date=_FIXED_NOW
         )
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            result = reporter.generate_report(empty_result)
+        result = reporter.generate_report(empty_result)
         
         assert isinstance(result, str)
         assert "No data" in result or "Empty" in result
     
-    def test_generate_report_invalid_input(self):
+    def test_generate_report_invalid_input(self, reporter):
         """Test report generation with invalid input."""
-        reporter = CLIReporter()
-        
         with pytest.raises((ValueError, TypeError)):
             reporter.generate_report(None)
     
-    def test_generate_summary_section(self, sample_analysis_result):
+    def test_generate_summary_section(self, reporter, sample_analysis_result):
         """Test summary section generation."""
-        reporter = CLIReporter()
-        
         summary = reporter._generate_summary_section(sample_analysis_result)
         
         assert isinstance(summary, str)
@@ -92,10 +141,8 @@ class TestCLIReporter:
         assert "Analysis Summary" in summary or "Summary" in summary
         assert str(sample_analysis_result.ticket_count) in summary
     
-    def test_generate_metrics_section(self, sample_analysis_result):
+    def test_generate_metrics_section(self, reporter, sample_analysis_result):
         """Test metrics section generation."""
-        reporter = CLIReporter()
-        
         metrics = reporter._generate_metrics_section(sample_analysis_result)
         
         assert isinstance(metrics, str)
@@ -106,10 +153,8 @@ class TestCLIReporter:
             assert metric_name in metrics
             assert str(metric_value) in metrics
     
-    def test_generate_trends_section(self, sample_analysis_result):
+    def test_generate_trends_section(self, reporter, sample_analysis_result):
         """Test trends section generation."""
-        reporter = CLIReporter()
-        
         trends = reporter._generate_trends_section(sample_analysis_result)
         
         assert isinstance(trends, str)
@@ -121,58 +166,40 @@ class TestCLIReporter:
             # Should handle empty trends gracefully
             assert "No trend data" in trends or len(trends) == 0
     
-    def test_format_metric_value_numeric(self):
+    @pytest.mark.parametrize("input_value,expected", [
+        (42, "42"),
+        (42.5, "42.5"),
+        (42.123456, "42.12"),  # Should round to 2 decimal places
+        (0, "0"),
+        (-5.5, "-5.5"),
+    ])
+    def test_format_metric_value_numeric(self, reporter, input_value, expected):
         """Test metric value formatting for numeric values."""
-        reporter = CLIReporter()
-        
-        test_cases = [
-            (42, "42"),
-            (42.5, "42.5"),
-            (42.123456, "42.12"),  # Should round to 2 decimal places
-            (0, "0"),
-            (-5.5, "-5.5")
-        ]
-        
-        for input_value, expected in test_cases:
-            result = reporter._format_metric_value(input_value)
-            assert expected in result
-    
-    def test_format_metric_value_string(self):
+        assert expected in reporter._format_metric_value(input_value)
+    
+    @pytest.mark.parametrize("input_value,expected", [
+        ("test_string", "test_string"),
+        ("", "N/A"),
+        ("   ", "N/A"),
+    ])
+    def test_format_metric_value_string(self, reporter, input_value, expected):
         """Test metric value formatting for string values."""
-        reporter = CLIReporter()
-        
-        test_cases = [
-            ("test_string", "test_string"),
-            ("", "N/A"),
-            ("   ", "N/A"),
-        ]
-        
-        for input_value, expected in test_cases:
-            result = reporter._format_metric_value(input_value)
-            assert expected in result
-    
-    def test_format_metric_value_complex_types(self):
+        assert expected in reporter._format_metric_value(input_value)
+    
+    @pytest.mark.parametrize("value,expected", [
+        pytest.param({"key1": "value1", "key2": "value2"}, "", id="dict"),
+        pytest.param(["item1", "item2", "item3"], "", id="list"),
+        pytest.param(None, "N/A", id="none"),
+    ])
+    def test_format_metric_value_complex_types(self, reporter, value, expected):
         """Test metric value formatting for complex types."""
-        reporter = CLIReporter()
-        
-        # Dictionary
-        dict_value = {"key1": "value1", "key2": "value2"}
-        dict_result = reporter._format_metric_value(dict_value)
-        assert isinstance(dict_result, str)
-        
-        # List
-        list_value = ["item1", "item2", "item3"]
-        list_result = reporter._format_metric_value(list_value)
-        assert isinstance(list_result, str)
+        result = reporter._format_metric_value(value)
         
-        # None
-        none_result = reporter._format_metric_value(None)
-        assert "N/A" in none_result
+        assert isinstance(result, str)
+        assert expected in result
     
-    def test_create_table_basic(self):
+    def test_create_table_basic(self, reporter):
         """Test basic table creation."""
-        reporter = CLIReporter()
-        
         headers = ["Metric", "Value", "Description"]
         rows = [
             ["Total Tickets", "100", "Total number of tickets"],
@@ -193,10 +220,8 @@ class TestCLIReporter:
             for cell in row:
                 assert cell in table
     
-    def test_create_table_empty_data(self):
+    def test_create_table_empty_data(self, reporter):
         """Test table creation with empty data."""
-        reporter = CLIReporter()
-        
         headers = ["Column1", "Column2"]
         rows = []
         
@@ -207,10 +232,8 @@ class TestCLIReporter:
         for header in headers:
             assert header in table
     
-    def test_create_table_mismatched_columns(self):
+    def test_create_table_mismatched_columns(self, reporter):
         """Test table creation with mismatched column counts."""
-        reporter = CLIReporter()
-        
         headers = ["Col1", "Col2", "Col3"]
         rows = [
             ["A", "B"],  # Missing column
@@ -251,42 +274,35 @@ class TestCLIReporter:
         # Should return original text when colors disabled
         assert colored_text == text
     
-    def test_apply_color_formatting_types(self):
+    @pytest.mark.parametrize("color_type", [
+        "success", "error", "warning", "info", "header"
+    ])
+    def test_apply_color_formatting_types(self, color_type):
         """Test different color formatting types."""
         config = ReportConfig(color_enabled=True)
         reporter = CLIReporter(config)
         
         text = "Test"
-        color_types = ["success", "error", "warning", "info", "header"]
+        result = reporter._apply_color_formatting(text, color_type)
         
-        for color_type in color_types:
-            result = reporter._apply_color_formatting(text, color_type)
-            assert isinstance(result, str)
-            assert text in result
-    
-    def test_format_percentage_value(self):
+        assert isinstance(result, str)
+        assert text in result
+    
+    @pytest.mark.parametrize("input_value,expected", [
+        (0.5, "50.0%"),
+        (0.123, "12.3%"),
+        (1.0, "100.0%"),
+        (0.0, "0.0%"),
+        (50.0, "50.0%"),  # Already in percentage form
+    ])
+    def test_format_percentage_value(self, reporter, input_value, expected):
         """Test percentage value formatting."""
-        reporter = CLIReporter()
-        
-        test_cases = [
-            (0.5, "50.0%"),
-            (0.123, "12.3%"),
-            (1.0, "100.0%"),
-            (0.0, "0.0%"),
-            (50.0, "50.0%"),  # Already in percentage form
-        ]
-        
-        for input_value, expected in test_cases:
-            result = reporter._format_percentage_value(input_value)
-            assert expected in result
+        assert expected in reporter._format_percentage_value(input_value)
     
-    def test_format_duration_value(self):
+    def test_format_duration_value(self, reporter):
         """Test duration value formatting."""
-        reporter = CLIReporter()
-        
         # Test with timedelta
-        duration = timedelta(hours=2, minutes=30)
-        result = reporter._format_duration_value(duration)
+        result = reporter._format_duration_value(_FIXED_DURATION)
         assert "2" in result and "30" in result
         
         # Test with numeric hours
@@ -294,10 +310,8 @@ class TestCLIReporter:
         result = reporter._format_duration_value(hours)
         assert "24" in result and "30" in result
     
-    def test_generate_key_insights(self, sample_analysis_result):
+    def test_generate_key_insights(self, reporter, sample_analysis_result):
         """Test key insights generation."""
-        reporter = CLIReporter()
-        
         insights = reporter._generate_key_insights(sample_analysis_result)
         
         assert isinstance(insights, str)
@@ -306,40 +320,32 @@ class TestCLIReporter:
             assert len(insights) > 0
             assert "Insights" in insights or "Key" in insights
     
-    def test_format_output_for_terminal_width(self):
+    def test_format_output_for_terminal_width(self, reporter):
         """Test output formatting for terminal width."""
-        reporter = CLIReporter()
-        
         long_text = "This is a very long line of text that should be wrapped to fit within the terminal width constraints."
         
         formatted_text = reporter._format_output_for_terminal_width(long_text, width=50)
         
         assert isinstance(formatted_text, str)
-        # Should not exceed specified width per line
-        lines = formatted_text.split('\n')
-        for line in lines:
-            # Remove color codes for length check
-            clean_line = reporter._strip_color_codes(line)
-            assert len(clean_line) <= 50
-    
-    def test_strip_color_codes(self):
+        # Should not exceed specified width per line, ignoring color codes
+        lines = _ANSI_RE.sub('', formatted_text).split('\n')
+        assert all(len(line) <= 50 for line in lines)
+    
+    def test_strip_color_codes(self, reporter):
         """Test color code stripping."""
-        reporter = CLIReporter()
-        
         # Test with ANSI color codes
         colored_text = "\033[31mRed text\033[0m"
         stripped = reporter._strip_color_codes(colored_text)
         assert stripped == "Red text"
+        assert stripped == _ANSI_RE.sub('', colored_text)
         
         # Test with no color codes
         plain_text = "Plain text"
         stripped = reporter._strip_color_codes(plain_text)
         assert stripped == plain_text
     
-    def test_calculate_table_column_widths(self):
+    def test_calculate_table_column_widths(self, reporter):
         """Test table column width calculation."""
-        reporter = CLIReporter()
-        
         headers = ["Short", "Medium Length", "Very Long Header Name"]
         rows = [
             ["A", "B", "C"],
@@ -358,9 +364,9 @@ class TestCLIReporter:
 class TestCLIReporterColorHandling:
     """Test color handling functionality."""
     
-    @patch('ticket_analyzer.reporting.cli_reporter.COLORAMA_AVAILABLE', True)
-    def test_colorama_available_true(self):
+    def test_colorama_available_true(self, monkeypatch):
         """Test behavior when colorama is available."""
+        monkeypatch.setattr(cli_reporter, "COLORAMA_AVAILABLE", True)
         config = ReportConfig(color_enabled=True)
         reporter = CLIReporter(config)
         
@@ -370,9 +376,9 @@ class TestCLIReporterColorHandling:
         # Should apply colors when available and enabled
         assert isinstance(colored, str)
     
-    @patch('ticket_analyzer.reporting.cli_reporter.COLORAMA_AVAILABLE', False)
-    def test_colorama_available_false(self):
+    def test_colorama_available_false(self, monkeypatch):
         """Test behavior when colorama is not available."""
+        monkeypatch.setattr(cli_reporter, "COLORAMA_AVAILABLE", False)
         config = ReportConfig(color_enabled=True)
         reporter = CLIReporter(config)
         
@@ -389,8 +395,9 @@ class TestCLIReporterColorHandling:
         
         # Test that same color type produces consistent results
         text = "Test"
-        result1 = reporter._apply_color_formatting(text, "error")
-        result2 = reporter._apply_color_formatting(text, "error")
+        fmt = reporter._apply_color_formatting
+        result1 = fmt(text, "error")
+        result2 = fmt(text, "error")
         
         assert result1 == result2
 
@@ -398,27 +405,23 @@ class TestCLIReporterColorHandling:
 class TestCLIReporterErrorHandling:
     """Test error handling in CLI reporter."""
     
-    def test_generate_report_with_corrupted_data(self):
+    def test_generate_report_with_corrupted_data(self, reporter):
         """Test report generation with corrupted analysis data."""
-        reporter = CLIReporter()
-        
         # Create analysis result with problematic data
         corrupted_result = AnalysisResult(
             metrics={"invalid": float('inf'), "none_value": None},
             trends={"bad_data": "not_a_dict"},
             summary={},
             ticket_count=-1,  # Invalid count
-            analysis_date=datetime.now()
+            analysis_date=_FIXED_NOW
         )
         
         # Should handle gracefully without crashing
         result = reporter.generate_report(corrupted_result)
         assert isinstance(result, str)
     
-    def test_table_creation_with_none_values(self):
+    def test_table_creation_with_none_values(self, reporter):
         """Test table creation with None values in data."""
-        reporter = CLIReporter()
-        
         headers = ["Col1", "Col2", "Col3"]
         rows = [
             ["A", None, "C"],
@@ -431,32 +434,34 @@ class TestCLIReporterErrorHandling:
         assert isinstance(table, str)
         assert "N/A" in table  # Should replace None with N/A
     
-    def test_format_metric_value_with_exceptions(self):
+    @pytest.mark.parametrize("value", [
+        pytest.param(float('inf'), id="inf"),
+        pytest.param(float('-inf'), id="-inf"),
+        pytest.param(float('nan'), id="nan"),
+        pytest.param(complex(1, 2), id="complex"),
+        pytest.param(object(), id="object"),
+    ])
+    def test_format_metric_value_with_exceptions(self, reporter, value):
         """Test metric value formatting with values that might cause exceptions."""
-        reporter = CLIReporter()
-        
-        problematic_values = [
-            float('inf'),
-            float('-inf'),
-            float('nan'),
-            complex(1, 2),
-            object(),
-        ]
-        
-        for value in problematic_values:
-            # Should not raise exceptions
-            result = reporter._format_metric_value(value)
-            assert isinstance(result, str)
+        # Should not raise exceptions
+        assert isinstance(reporter._format_metric_value(value), str)
     
     @patch('ticket_analyzer.reporting.cli_reporter.logger')
     def test_error_logging_during_report_generation(self, mock_logger):
         """Test error logging during report generation."""
         reporter = CLIReporter()
         
+        # generate_report does not type-check its input, so a plain namespace
+        # is enough to reach the patched section.
+        fake_result = SimpleNamespace(
+            metrics={}, trends={}, summary={}, ticket_count=0,
+            analysis_date=_FIXED_NOW
+        )
+        
         # Mock a method to raise an exception
         with patch.object(reporter, '_generate_summary_section', side_effect=Exception("Test error")):
             with pytest.raises(ReportGenerationError):
-                reporter.generate_report(Mock())
+                reporter.generate_report(fake_result)
         
         # Should log the error
         mock_logger.error.assert_called()
@@ -465,7 +470,7 @@ class TestCLIReporterErrorHandling:
 class TestCLIReporterIntegration:
     """Integration tests for CLI reporter."""
     
-    def test_full_report_generation_workflow(self, sample_analysis_result):
+    def test_full_report_generation_workflow(self, sample_analysis_result, capsys):
         """Test complete report generation workflow."""
         config = ReportConfig(
             color_enabled=True,
@@ -478,8 +483,7 @@ class TestCLIReporterIntegration:
         
         reporter = CLIReporter(config)
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            result = reporter.generate_report(sample_analysis_result)
+        result = reporter.generate_report(sample_analysis_result)
         
         # Verify complete report structure
         assert isinstance(result, str)
@@ -487,56 +491,53 @@ class TestCLIReporterIntegration:
         
         # Should contain all major sections
         assert "Summary" in result or "Analysis" in result
-        assert any(metric in result for metric in sample_analysis_result.metrics.keys())
+        metric_names = re.compile(
+            '|'.join(map(re.escape, sample_analysis_result.metrics))
+        )
+        assert metric_names.search(result) is not None
         
         # Should have written to stdout
-        stdout_output = mock_stdout.getvalue()
+        stdout_output = capsys.readouterr().out
         assert len(stdout_output) > 0
     
-    def test_report_generation_with_different_configs(self, sample_analysis_result):
+    @pytest.mark.parametrize("config_kwargs", [
+        {"color_enabled": True, "table_style": "simple"},
+        {"color_enabled": False, "table_style": "grid"},
+        {"max_table_width": 80, "show_trends": False},
+        {"show_summary": False, "show_metrics": True},
+    ], ids=["simple-color", "grid-nocolor", "narrow", "no-summary"])
+    def test_report_generation_with_different_configs(self, config_kwargs,
+                                                      sample_analysis_result):
         """Test report generation with different configuration options."""
-        configs = [
-            ReportConfig(color_enabled=True, table_style="simple"),
-            ReportConfig(color_enabled=False, table_style="grid"),
-            ReportConfig(max_table_width=80, show_trends=False),
-            ReportConfig(show_summary=False, show_metrics=True)
-        ]
+        reporter = CLIReporter(ReportConfig(**config_kwargs))
+        result = reporter.generate_report(sample_analysis_result)
         
-        for config in configs:
-            reporter = CLIReporter(config)
-            result = reporter.generate_report(sample_analysis_result)
-            
-            assert isinstance(result, str)
-            assert len(result) > 0
+        assert isinstance(result, str)
+        assert len(result) > 0
     
-    def test_report_output_consistency(self, sample_analysis_result):
+    def test_report_output_consistency(self, reporter, cached_report,
+                                       sample_analysis_result):
         """Test that report output is consistent across multiple generations."""
-        reporter = CLIReporter()
-        
-        result1 = reporter.generate_report(sample_analysis_result)
-        result2 = reporter.generate_report(sample_analysis_result)
-        
         # Results should be identical for same input
-        assert result1 == result2
+        assert _generate_at_fixed_time(reporter, sample_analysis_result) == cached_report
     
-    def test_large_dataset_report_performance(self):
-        """Test report generation performance with large dataset."""
-        # Create analysis result with large amount of data
-        large_metrics = {f"metric_{i}": i * 1.5 for i in range(100)}
-        large_trends = {f"trend_{i}": {"data": list(range(50))} for i in range(20)}
-        
-        large_result = AnalysisResult(
-            metrics=large_metrics,
-            trends=large_trends,
-            summary={"total_tickets": 10000, "key_insights": ["Insight 1", "Insight 2"]},
-            ticket_count=10000,
-            analysis_date=datetime.now()
-        )
+    def test_multi_metric_report_generation(self, reporter):
+        """Test report generation with several metrics and trend series.
         
-        reporter = CLIReporter()
+        The full-size dataset is exercised by the slow benchmark below.
+        """
+        result = reporter.generate_report(_large_result(10, 2, 5), ReportConfig())
+        
+        assert isinstance(result, str)
+        assert len(result) > 0
+    
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_large_dataset_report_benchmark(self, reporter, benchmark):
+        """Benchmark report generation at full size (100 metrics, 20 trends)."""
+        large_result = _large_result(100, 20, 50)
         
-        # Should complete without timeout
-        result = reporter.generate_report(large_result)
+        result = benchmark(reporter.generate_report, large_result, ReportConfig())
         
         assert isinstance(result, str)
         assert len(result) > 0
@@ -585,5 +586,6 @@ class TestCLIReporterAccessibility:
         reporter = CLIReporter(config)
         result = reporter.generate_report(sample_analysis_result)
         
-        # Should only contain basic ASCII characters
-        assert all(ord(char) < 128 for char in result if char.isprintable())
\ No newline at end of file
+        # Should only contain basic ASCII characters; non-printable control
+        # characters are ignored, so only fall back to filtering when needed.
+        assert result.isascii() or "".join(filter(str.isprintable, result)).isascii()
\ No newline at end of file
@@ -12,6 +12,15 @@ from typing import Dict, Any, List
 from unittest.mock import Mock, patch, MagicMock
 import base64
 import io
+import struct
+
+# Select the non-interactive backend before charts (and pyplot) are imported so
+# no GUI backend is probed on headless workers.
+import matplotlib
+matplotlib.use("Agg", force=True)
+matplotlib.rcParams["interactive"] = False
+matplotlib.rcParams["figure.max_open_warning"] = 0
+from matplotlib.axes import Axes
 
 from ticket_analyzer.reporting.charts import ChartGenerator
 from ticket_analyzer.models.analysis import AnalysisResult
@@ -126,8 +135,8 @@ class TestChartGenerator:
             "status_percentages": {"OPEN": 22.7, "RESOLVED": 68.2, "IN_PROGRESS": 9.1}
         }
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.pie') as mock_pie, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'pie') as mock_pie, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_pie_chart"
@@ -159,8 +168,8 @@ class TestChartGenerator:
             "avg_resolution_time_hours": 11.5
         }
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.bar') as mock_bar, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'bar') as mock_bar, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_bar_chart"
@@ -186,8 +195,8 @@ class TestChartGenerator:
             }
         }
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.plot') as mock_plot, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'plot') as mock_plot, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_line_chart"
@@ -208,8 +217,8 @@ class TestChartGenerator:
             "severity_percentages": {"HIGH": 15.0, "MEDIUM": 60.0, "LOW": 25.0}
         }
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.bar') as mock_bar, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'bar') as mock_bar, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_severity_chart"
@@ -409,8 +418,8 @@ class TestChartGeneratorAdvancedCharts:
             [1, 2, 4, 6, 7, 8, 5, 3]         # Sunday
         ]
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.imshow') as mock_imshow, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'imshow') as mock_imshow, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_heatmap"
@@ -429,8 +438,8 @@ class TestChartGeneratorAdvancedCharts:
         x_data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         y_data = [2, 4, 3, 6, 5, 8, 7, 9, 8, 10]
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.scatter') as mock_scatter, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'scatter') as mock_scatter, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_scatter"
@@ -450,8 +459,8 @@ class TestChartGeneratorAdvancedCharts:
         open_counts = [5, 15, 10]
         resolved_counts = [10, 45, 15]
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.bar') as mock_bar, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'bar') as mock_bar, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_stacked_bar"
@@ -483,7 +492,7 @@ class TestChartGeneratorSeabornIntegration:
         resolution_times = [2.5, 4.0, 1.5, 8.0, 6.5, 3.0, 12.0, 5.5, 7.0, 9.5]
         
         with patch('seaborn.histplot') as mock_histplot, \
-             patch('matplotlib.pyplot.figure') as mock_figure, \
+             patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_seaborn_dist"
@@ -506,7 +515,7 @@ class TestChartGeneratorSeabornIntegration:
         }
         
         with patch('seaborn.boxplot') as mock_boxplot, \
-             patch('matplotlib.pyplot.figure') as mock_figure, \
+             patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_seaborn_box"
@@ -522,18 +531,16 @@ class TestChartGeneratorErrorHandling:
     """Test error handling in chart generation."""
     
     def test_matplotlib_import_error(self):
-        """Test handling of matplotlib import errors."""
-        with patch('matplotlib.pyplot.figure', side_effect=ImportError("matplotlib not available")):
-            generator = ChartGenerator()
-            
-            with pytest.raises(ReportGenerationError, match="Chart generation requires matplotlib"):
-                generator._generate_status_distribution_chart({})
+        """Test that a Figure construction failure surfaces from the constructor."""
+        with patch('ticket_analyzer.reporting.charts.Figure', side_effect=ImportError("matplotlib not available")):
+            with pytest.raises(ImportError, match="matplotlib not available"):
+                ChartGenerator()
     
     def test_chart_generation_memory_error(self):
         """Test handling of memory errors during chart generation."""
         generator = ChartGenerator()
         
-        with patch('matplotlib.pyplot.figure', side_effect=MemoryError("Out of memory")):
+        with patch.object(generator, '_create_figure', side_effect=MemoryError("Out of memory")):
             with pytest.raises(ReportGenerationError, match="Insufficient memory"):
                 generator._generate_status_distribution_chart({})
     
@@ -569,7 +576,7 @@ class TestChartGeneratorErrorHandling:
         """Test error logging during chart generation."""
         generator = ChartGenerator()
         
-        with patch('matplotlib.pyplot.figure', side_effect=Exception("Chart error")):
+        with patch.object(generator, '_create_figure', side_effect=Exception("Chart error")):
             with pytest.raises(ReportGenerationError):
                 generator._generate_status_distribution_chart({})
         
@@ -590,8 +597,8 @@ class TestChartGeneratorPerformance:
             }
         }
         
-        with patch('matplotlib.pyplot.figure') as mock_figure, \
-             patch('matplotlib.pyplot.plot') as mock_plot, \
+        with patch.object(generator, '_create_figure', wraps=generator._create_figure) as mock_figure, \
+             patch.object(Axes, 'plot') as mock_plot, \
              patch.object(generator, '_convert_figure_to_base64') as mock_convert:
             
             mock_convert.return_value = "base64_large_chart"
@@ -613,8 +620,8 @@ class TestChartGeneratorPerformance:
                 "status_counts": {"OPEN": i * 5, "RESOLVED": i * 10}
             }
             
-            with patch('matplotlib.pyplot.figure'), \
-                 patch('matplotlib.pyplot.pie'), \
+            with patch.object(generator, '_create_figure', wraps=generator._create_figure), \
+                 patch.object(Axes, 'pie'), \
                  patch.object(generator, '_convert_figure_to_base64') as mock_convert:
                 
                 mock_convert.return_value = f"base64_chart_{i}"
@@ -624,6 +631,18 @@ class TestChartGeneratorPerformance:
         
         # Should complete without memory issues
     
+    def test_charts_not_registered_with_pyplot(self):
+        """Test that rendered charts never open pyplot-managed figures."""
+        import matplotlib.pyplot as plt
+        
+        plt.close("all")
+        generator = ChartGenerator()
+        
+        result = generator.create_bar_chart({"OPEN": 5, "RESOLVED": 10})
+        
+        assert result.startswith("data:image/png;base64,")
+        assert plt.get_fignums() == []
+    
     def test_chart_generation_timeout_handling(self):
         """Test handling of chart generation timeouts."""
         generator = ChartGenerator()
@@ -652,6 +671,68 @@ class TestChartGeneratorPerformance:
             assert "data:image/png;base64," in result
 
 
+def _png_size(data_uri: str) -> tuple:
+    """Return the (width, height) in pixels of a base64 PNG data URI."""
+    png = base64.b64decode(data_uri.split(",", 1)[1])
+    return struct.unpack(">II", png[16:24])
+
+
+class TestChartGeneratorFigureReuse:
+    """Test rendering on the generator's shared figure."""
+    
+    def test_consecutive_charts_share_cleared_figure(self):
+        """Test that each chart clears the shared figure before drawing."""
+        generator = ChartGenerator()
+        figure = generator._figure
+        
+        bar_chart = generator.create_bar_chart({"OPEN": 5, "RESOLVED": 10})
+        pie_chart = generator.create_pie_chart({"OPEN": 5, "RESOLVED": 10})
+        
+        assert bar_chart.startswith("data:image/png;base64,")
+        assert pie_chart.startswith("data:image/png;base64,")
+        assert generator._figure is figure
+        assert len(generator._figure.axes) == 1
+    
+    def test_all_chart_types_render_on_one_axes(self):
+        """Test that every chart type leaves only its own axes on the figure."""
+        generator = ChartGenerator()
+        renders = [
+            lambda: generator.create_line_chart({"x": [1, 2, 3], "y": [4, 5, 6]}),
+            lambda: generator.create_bar_chart({"OPEN": 5, "RESOLVED": 10}, horizontal=True),
+            lambda: generator.create_pie_chart({"OPEN": 5, "RESOLVED": 10}),
+            lambda: generator.create_scatter_plot({"x": [1, 2], "y": [2, 1]}),
+            lambda: generator.create_time_series_chart({
+                "timestamps": ["2024-01-01", "2024-01-02", "2024-01-03"],
+                "values": [1, 3, 2]
+            }),
+            lambda: generator._create_weekly_trends_chart({
+                "OPEN": {"2024-W01": 3, "2024-W02": 5},
+                "RESOLVED": {"2024-W01": 2, "2024-W02": 4}
+            }),
+        ]
+        
+        # The heatmap adds a colorbar axes; the next chart must clear it.
+        generator.create_heatmap({"row1": {"a": 1.0, "b": 2.0}, "row2": {"a": 3.0, "b": 4.0}})
+        
+        for render in renders:
+            assert render().startswith("data:image/png;base64,")
+            assert len(generator._figure.axes) == 1
+    
+    def test_figure_size_and_dpi_changes_apply(self):
+        """Test that figure_size and dpi changes affect the next render."""
+        generator = ChartGenerator(figure_size=(4, 3), dpi=50)
+        data = {"OPEN": 5, "RESOLVED": 10}
+        
+        small_width, small_height = _png_size(generator.create_bar_chart(data))
+        
+        generator.figure_size = (8, 6)
+        generator.dpi = 100
+        large_width, large_height = _png_size(generator.create_bar_chart(data))
+        
+        assert large_width > small_width * 3
+        assert large_height > small_height * 3
+
+
 class TestChartGeneratorCustomization:
     """Test chart customization features."""
     
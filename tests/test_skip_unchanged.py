@@ -0,0 +1,55 @@
+"""Tests for the --skip-unchanged option defined in the shared conftest."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import ticket_analyzer
+
+pytest_plugins = ["pytester"]
+
+pytest.importorskip("xdist")
+
+_GROUPED_TEST = '''
+import pytest
+
+
+@pytest.mark.xdist_group("exceptions")
+@pytest.mark.depends_on("ticket_analyzer.models.exceptions")
+def test_grouped():
+    assert True
+'''
+
+
+@pytest.fixture
+def skip_unchanged_pytester(pytester, monkeypatch):
+    """Pytester project using the real conftest and one grouped depends_on test."""
+    conftest = Path(__file__).with_name("conftest.py")
+    pytester.makeconftest(conftest.read_text())
+    pytester.makepyfile(test_grouped=_GROUPED_TEST)
+    
+    package_root = str(Path(ticket_analyzer.__file__).parent.parent)
+    monkeypatch.setenv(
+        "PYTHONPATH",
+        os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")]))
+    )
+    return pytester
+
+
+_PARALLEL = ["-n", "2", "--dist", "loadgroup"]
+_SERIAL = ["-p", "no:xdist"]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("first, second", [
+    (_PARALLEL, _SERIAL),
+    (_SERIAL, _PARALLEL),
+], ids=["parallel-then-serial", "serial-then-parallel"])
+def test_digest_reused_across_xdist_modes(skip_unchanged_pytester, first, second):
+    """Test a digest saved under one xdist mode is reused under the other."""
+    first_run = skip_unchanged_pytester.runpytest_subprocess("--skip-unchanged", *first)
+    first_run.assert_outcomes(passed=1)
+    
+    second_run = skip_unchanged_pytester.runpytest_subprocess("--skip-unchanged", *second)
+    second_run.assert_outcomes(skipped=1)
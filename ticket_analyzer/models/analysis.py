@@ -5,6 +5,7 @@ analysis results, and related data structures used throughout the analysis pipel
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -12,8 +13,15 @@ from enum import Enum
 
 from .ticket import TicketStatus, TicketSeverity
 
+# Slotted dataclasses (no per-instance __dict__) require Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Enum member -> wire value, resolved once instead of per conversion
+_STATUS_VALUES: Dict[TicketStatus, str] = {s: s.value for s in TicketStatus}
+_SEVERITY_VALUES: Dict[TicketSeverity, str] = {s: s.value for s in TicketSeverity}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchCriteria:
     """Search criteria for ticket queries.
     
@@ -56,9 +64,9 @@ class SearchCriteria:
         criteria = {}
         
         if self.status:
-            criteria["status"] = [s.value for s in self.status]
+            criteria["status"] = [_STATUS_VALUES[s] for s in self.status]
         if self.severity:
-            criteria["severity"] = [s.value for s in self.severity]
+            criteria["severity"] = [_SEVERITY_VALUES[s] for s in self.severity]
         if self.assignee:
             criteria["assignee"] = self.assignee
         if self.resolver_group:
@@ -89,11 +97,11 @@ class SearchCriteria:
         query_parts = []
         
         if self.status:
-            status_values = [f'"{s.value}"' for s in self.status]
+            status_values = [f'"{_STATUS_VALUES[s]}"' for s in self.status]
             query_parts.append(f"status:({' OR '.join(status_values)})")
         
         if self.severity:
-            severity_values = [f'"{s.value}"' for s in self.severity]
+            severity_values = [f'"{_SEVERITY_VALUES[s]}"' for s in self.severity]
             query_parts.append(f"severity:({' OR '.join(severity_values)})")
         
         if self.assignee:
@@ -143,7 +151,7 @@ class SearchCriteria:
                 raise ValueError("updated_after must be before updated_before")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnalysisResult:
     """Results from ticket analysis operations.
     
@@ -241,7 +249,7 @@ class AnalysisResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MetricDefinition:
     """Definition of a metric that can be calculated.
     
@@ -259,7 +267,7 @@ class MetricDefinition:
     calculation_method: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TrendPoint:
     """A single point in a trend analysis.
     
@@ -275,7 +283,7 @@ class TrendPoint:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TrendAnalysis:
     """Trend analysis results for a specific metric.
     
@@ -16,8 +16,9 @@ import json
 try:
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    from matplotlib.axes import Axes
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     from matplotlib.figure import Figure
 except ImportError:
     raise ImportError("matplotlib is required for chart generation. Install with: pip install matplotlib")
@@ -73,8 +74,13 @@ class ChartGenerator:
             'grid_alpha': 0.3
         }
         
+        # One figure and canvas are reused for every chart; each chart clears
+        # it first, which is much cheaper than allocating a new Figure.
+        self._figure = Figure(figsize=self.figure_size, dpi=self.dpi)
+        self._canvas = FigureCanvasAgg(self._figure)
+        
         # Configure matplotlib defaults
-        plt.rcParams.update({
+        matplotlib.rcParams.update({
             'font.size': self.style['font_size'],
             'axes.titlesize': self.style['title_size'],
             'axes.labelsize': self.style['label_size'],
@@ -99,6 +105,11 @@ class ChartGenerator:
         try:
             charts = {}
             
+            # Charts are rendered one after another on the shared figure. A
+            # process pool does not pay off here: each spawned worker has to
+            # re-import matplotlib, seaborn and pandas, which costs far more
+            # than rendering the handful of charts in a report.
+            
             # Generate charts based on available metrics
             if analysis.metrics:
                 charts.update(self._generate_metrics_charts(analysis.metrics))
@@ -130,7 +141,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             if isinstance(data, dict) and 'x' in data and 'y' in data:
                 ax.plot(data['x'], data['y'], linewidth=2, color=self.color_palette[0])
@@ -147,14 +158,12 @@ class ChartGenerator:
             ax.set_ylabel(y_label)
             ax.grid(True, alpha=self.style['grid_alpha'])
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create line chart: {e}")
             raise ReportGenerationError(f"Line chart creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def create_bar_chart(self, data: Dict[str, Union[int, float]], title: str = "Bar Chart",
                         x_label: str = "Categories", y_label: str = "Values",
@@ -172,7 +181,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             categories = list(data.keys())
             values = list(data.values())
@@ -188,7 +197,9 @@ class ChartGenerator:
                 
                 # Rotate x-axis labels if they're long
                 if any(len(str(cat)) > 10 for cat in categories):
-                    plt.xticks(rotation=45, ha='right')
+                    ax.tick_params(axis='x', labelrotation=45)
+                    for label in ax.get_xticklabels():
+                        label.set_horizontalalignment('right')
             
             ax.set_title(title, fontsize=self.style['title_size'], fontweight='bold')
             ax.grid(True, alpha=self.style['grid_alpha'])
@@ -204,14 +215,12 @@ class ChartGenerator:
                     ax.text(bar.get_x() + bar.get_width()/2, height,
                            f'{height:.1f}', ha='center', va='bottom')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create bar chart: {e}")
             raise ReportGenerationError(f"Bar chart creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def create_pie_chart(self, data: Dict[str, Union[int, float]], title: str = "Pie Chart",
                         show_percentages: bool = True) -> str:
@@ -226,7 +235,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             labels = list(data.keys())
             values = list(data.values())
@@ -251,14 +260,12 @@ class ChartGenerator:
                     autotext.set_color('white')
                     autotext.set_fontweight('bold')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create pie chart: {e}")
             raise ReportGenerationError(f"Pie chart creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def create_heatmap(self, data: Union[Dict[str, Dict[str, float]], pd.DataFrame],
                       title: str = "Heatmap", x_label: str = "X", y_label: str = "Y") -> str:
@@ -274,7 +281,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             # Convert data to DataFrame if needed
             if isinstance(data, dict):
@@ -290,14 +297,12 @@ class ChartGenerator:
             ax.set_xlabel(x_label)
             ax.set_ylabel(y_label)
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create heatmap: {e}")
             raise ReportGenerationError(f"Heatmap creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def create_scatter_plot(self, data: Dict[str, List[float]], title: str = "Scatter Plot",
                            x_label: str = "X", y_label: str = "Y") -> str:
@@ -313,7 +318,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             x_data = data.get('x', [])
             y_data = data.get('y', [])
@@ -334,14 +339,12 @@ class ChartGenerator:
             ax.set_ylabel(y_label)
             ax.grid(True, alpha=self.style['grid_alpha'])
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create scatter plot: {e}")
             raise ReportGenerationError(f"Scatter plot creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def create_time_series_chart(self, data: Dict[str, List], title: str = "Time Series",
                                y_label: str = "Value") -> str:
@@ -356,7 +359,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             timestamps = data.get('timestamps', [])
             values = data.get('values', [])
@@ -375,21 +378,19 @@ class ChartGenerator:
             if timestamps and isinstance(timestamps[0], datetime):
                 ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
                 ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(timestamps)//10)))
-                plt.xticks(rotation=45)
+                ax.tick_params(axis='x', labelrotation=45)
             
             ax.set_title(title, fontsize=self.style['title_size'], fontweight='bold')
             ax.set_xlabel("Time")
             ax.set_ylabel(y_label)
             ax.grid(True, alpha=self.style['grid_alpha'])
             
-            plt.tight_layout()
+            fig.tight_layout()
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create time series chart: {e}")
             raise ReportGenerationError(f"Time series chart creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def _generate_metrics_charts(self, metrics: Dict[str, Any]) -> Dict[str, str]:
         """Generate charts for metrics data.
@@ -503,7 +504,7 @@ class ChartGenerator:
             Base64-encoded chart image.
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+            fig, ax = self._create_figure()
             
             # Convert weekly data to plottable format
             weeks = []
@@ -541,16 +542,14 @@ class ChartGenerator:
             ax.grid(True, alpha=self.style['grid_alpha'])
             
             # Rotate x-axis labels
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
             
             return self._figure_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Failed to create weekly trends chart: {e}")
             raise ReportGenerationError(f"Weekly trends chart creation failed: {e}")
-        finally:
-            plt.close(fig)
     
     def _create_volume_trends_chart(self, volume_data: Any) -> str:
         """Create volume trends chart.
@@ -579,6 +578,24 @@ class ChartGenerator:
             logger.error(f"Failed to create volume trends chart: {e}")
             raise ReportGenerationError(f"Volume trends chart creation failed: {e}")
     
+    def _create_figure(self) -> Tuple[Figure, Axes]:
+        """Reset the shared figure and give it a single fresh axes.
+        
+        The figure is built directly rather than through pyplot, so it is
+        never registered with pyplot's global figure manager and needs no
+        explicit close. Size and resolution are re-applied on every call so
+        changes to ``figure_size`` or ``dpi`` take effect. Because the figure
+        is shared, a generator must not render two charts concurrently.
+        
+        Returns:
+            Tuple of the shared figure and its new axes.
+        """
+        fig = self._figure
+        fig.clear()
+        fig.set_size_inches(self.figure_size)
+        fig.set_dpi(self.dpi)
+        return fig, fig.add_subplot(111)
+    
     def _figure_to_base64(self, fig: Figure) -> str:
         """Convert matplotlib figure to base64 string.
         
@@ -612,7 +629,7 @@ class ChartGenerator:
         self.style.update(style_config)
         
         # Update matplotlib parameters
-        plt.rcParams.update({
+        matplotlib.rcParams.update({
             'font.size': self.style.get('font_size', 10),
             'axes.titlesize': self.style.get('title_size', 14),
             'axes.labelsize': self.style.get('label_size', 12),